@@ -1,42 +1,13 @@
-from kivy.graphics import Color, Ellipse
-from kivy.graphics.texture import Texture
 import math
 
+import numpy as np
+
 from lib.SpingleColors import SpingleColors
 from lib.MouseControlSystem import MouseControlSystem
 from lib.SpringleParams import SpringleParams
 from lib.OrbitGroup import OrbitGroup
 from lib.TrailStore import TrailStore
 
-class GradientCache:
-    """Optimized cache system for gradient textures in Kivy"""
-    def __init__(self, size_step=2, alpha_step=16):
-        self.size_step = size_step
-        self.alpha_step = alpha_step
-        self._cache = {}
-
-    def get_key(self, size, color, alpha, sharpness):
-        """Get cache key with minimal computation"""
-        size_rounded = round(size / self.size_step) * self.size_step
-        alpha_rounded = round(alpha / self.alpha_step) * self.alpha_step
-        sharpness_rounded = round(sharpness * 10) / 10  # Round to nearest 0.1
-        return (size_rounded, color[0], color[1], color[2], alpha_rounded, sharpness_rounded)
-
-    def get(self, key):
-        """Get item from cache"""
-        return self._cache.get(key)
-
-    def set(self, key, texture):
-        """Set item in cache"""
-        self._cache[key] = texture
-
-        # Simple cache size management
-        if len(self._cache) > 1000:  # Arbitrary limit
-            # Remove oldest 20% of entries
-            remove_count = len(self._cache) // 5
-            for k in list(self._cache.keys())[:remove_count]:
-                del self._cache[k]
-        
 class KivySpingleCircle:
     def __init__(self, min_circles, max_circles, 
                  radial_velocity, angular_velocity,
@@ -79,67 +50,17 @@ class KivySpingleCircle:
         self.spawn_cooldown_current = self.spawn_cooldown_start
         self.fade_duration = 10.0
         self.simulation_time = 0.0
+        self.max_alpha = self.params.max_alpha
+        
+        # Fraction of a step between the previous and the latest update at which
+        # current circles are drawn; 1 draws the latest state as is
+        self.render_alpha = 1.0
 
         # Initialize systems
-        self.colors = SpingleColors()
+        self.colors = SpingleColors.shared()
         self.mouse_control = MouseControlSystem()
         self.mouse_control.set_screen_center(self.center)
 
-        # Initialize gradient cache
-        self.gradient_cache = GradientCache(size_step=2, alpha_step=2)
-        self.max_cached_size = 10000
-
-    def _create_gradient_texture(self, size, color, alpha, sharpness=2.0):
-        """Create a circular gradient texture for Kivy"""
-        import numpy as np
-
-        # Create texture
-        texture_size = int(size * 1.2)
-        # Ensure even size for texture
-        texture_size = texture_size + (texture_size % 2)
-
-        # Create gradient data
-        x = np.linspace(-1, 1, texture_size)
-        y = np.linspace(-1, 1, texture_size)
-        xx, yy = np.meshgrid(x, y)
-
-        # Calculate radial gradient with adjustable sharpness
-        distance = np.sqrt(xx*xx + yy*yy)
-        # Apply sharpness to the gradient calculation
-        gradient = np.clip(1 - distance, 0, 1) ** sharpness
-
-        # Create RGBA array
-        rgba = np.zeros((texture_size, texture_size, 4), dtype=np.uint8)
-        rgba[..., 0] = np.minimum(color[0] * gradient, 255).astype(np.uint8)
-        rgba[..., 1] = np.minimum(color[1] * gradient, 255).astype(np.uint8)
-        rgba[..., 2] = np.minimum(color[2] * gradient, 255).astype(np.uint8)
-        rgba[..., 3] = np.minimum(alpha * gradient, alpha).astype(np.uint8)
-
-        # Create Kivy texture
-        texture = Texture.create(size=(texture_size, texture_size), colorfmt='rgba')
-        texture.blit_buffer(rgba.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
-
-        return texture
-
-    def _get_cache_key(self, size: float, color: tuple, alpha: int, sharpness: float) -> tuple:
-        """Get cache key with minimal computation"""
-        # Round size and alpha to reduce cache variations
-        size_rounded = round(size / self.size_step) * self.size_step
-        alpha_rounded = round(alpha / self.alpha_step) * self.alpha_step
-        sharpness_rounded = round(sharpness * 10) / 10  # Round to nearest 0.1
-        return (size_rounded, color[0], color[1], color[2], alpha_rounded, sharpness_rounded)
-
-    def _get_cached_gradient(self, size, color, alpha, sharpness):
-        """Get or create cached gradient texture"""
-        cache_key = self.gradient_cache.get_key(size, color, alpha, sharpness)
-        texture = self.gradient_cache.get(cache_key)
-
-        if texture is None and size <= self.max_cached_size:
-            texture = self._create_gradient_texture(size, color, alpha, sharpness)
-            self.gradient_cache.set(cache_key, texture)
-
-        return texture
-    
     def _create_group(self, min_circles, max_circles, radius, base_size, 
                      radial_velocity, angular_velocity,
                      radial_acceleration, angular_acceleration, 
@@ -220,6 +141,8 @@ class KivySpingleCircle:
     def clear_trails(self):
         """Clear all trails."""
         self.trail_store.clear_all()
+        for group in self.groups:
+            group.reset_trail_positions()
                 
     def clear_groups(self):
         """Clear all groups and associated resources."""
@@ -240,6 +163,7 @@ class KivySpingleCircle:
         """Optimized update simulation state."""
         # Update simulation time
         self.simulation_time = self.simulation_time + dt
+        self.max_alpha = params.max_alpha
         
         # Handle the group updates
         active_groups = self.group_update(dt, params)
@@ -312,26 +236,33 @@ class KivySpingleCircle:
             self._create_new_group(params)
           
         
-    def draw(self, screen, gradient_sharpness=2.0):
-        """Draw all circles and trails."""
-        # Get drawable elements from trail store
-        trail_elements = self.trail_store.get_drawable_elements()
-        
-        # Draw all elements in order
-        # print ('Elements: ', len(trail_elements))
-        for element in trail_elements: # + circle_elements:
-            texture = self._get_cached_gradient(
-                element.size,
-                element.color,
-                element.alpha,
-                gradient_sharpness  # Pass sharpness parameter
-            )
+    def _head_columns(self):
+        """Get the current circles of active groups, interpolated by render_alpha."""
+        xs, ys, sizes, colors = [], [], [], []
+        for group in self.groups:
+            if not group.active or not group.circles:
+                continue
+            x, y = group.get_interpolated_positions(self.render_alpha, self.center)
+            xs.append(x)
+            ys.append(y)
+            sizes.append(np.full(len(x), group.calculate_circle_size(group.circles[0])))
+            color = self.colors.getColor(group.palette_index,
+                                         group.circles[0]['color_index'],
+                                         group.color_transition)
+            colors.append(np.tile(np.asarray(color, dtype=np.uint8), (len(x), 1)))
+        if not xs:
+            return None
+        return {'x': np.concatenate(xs), 'y': np.concatenate(ys),
+                'size': np.concatenate(sizes), 'rgb': np.concatenate(colors)}
 
-            # Color(element.color[0]/255, element.color[1]/255,element.color[2]/255, element.alpha)  # Reset color to white for texture blending
-            Ellipse(
-                texture=texture,
-                pos=(element.x - element.size/2,
-                     element.y - element.size/2),
-                size=(element.size, element.size),
-                segments=12
-            )
+    def draw(self, renderer, gradient_sharpness=2.0):
+        """Draw all trails through a MeshRenderer, oldest first, with the current circles on top."""
+        columns, alphas = self.trail_store.get_drawable_elements()
+        heads = self._head_columns()
+        if heads is not None:
+            # Trail points only move once per update; the heads move smoothly in between
+            columns = {name: np.concatenate((columns[name], heads[name]))
+                       for name in ('x', 'y', 'size', 'rgb')}
+            alphas = np.concatenate((alphas, np.full(len(heads['x']), self.max_alpha)))
+        renderer.update(columns['x'], columns['y'], columns['size'], columns['rgb'],
+                        alphas, gradient_sharpness)
@@ -0,0 +1,142 @@
+from kivy.graphics import Mesh, RenderContext
+import numpy as np
+
+# The radial gradient is computed per fragment from the quad's local
+# coordinates, so no gradient textures are needed. Only GLSL 1.10 / ES 2.0
+# features are used, which software GL implementations such as Mesa's
+# llvmpipe support.
+VERTEX_SHADER = '''
+$HEADER$
+attribute vec4 vColor;
+attribute float vSharpness;
+varying float frag_sharpness;
+
+void main(void) {
+    frag_color = vColor;
+    frag_sharpness = vSharpness;
+    tex_coord0 = vTexCoords0;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition.xy, 0.0, 1.0);
+}
+'''
+
+FRAGMENT_SHADER = '''
+$HEADER$
+varying float frag_sharpness;
+
+void main(void) {
+    // tex_coord0 runs from -1 to 1 across the quad, so the circle edge is at 1
+    float radius = length(tex_coord0);
+    float gradient = radius < 1.0 ? pow(1.0 - radius, frag_sharpness) : 0.0;
+    gl_FragColor = vec4(frag_color.rgb * gradient, frag_color.a * gradient);
+}
+'''
+
+VERTEX_FORMAT = [
+    (b'vPosition', 2, 'float'),
+    (b'vTexCoords0', 2, 'float'),
+    (b'vColor', 4, 'float'),
+    (b'vSharpness', 1, 'float'),
+]
+FLOATS_PER_VERTEX = 9
+
+# Mesh indices are unsigned shorts, so a single Mesh addresses at most 65536 vertices
+MAX_QUADS_PER_MESH = 65536 // 4
+
+# Corner offsets in units of the point size
+CORNER_X = np.array([-0.5, 0.5, 0.5, -0.5], dtype=np.float32)
+CORNER_Y = np.array([-0.5, -0.5, 0.5, 0.5], dtype=np.float32)
+
+
+class MeshRenderer:
+    """
+    Draws trail points as radial gradient quads in a few persistent Mesh instructions.
+
+    Every frame the vertices of all points are written into one NumPy buffer
+    and the meshes are pointed at consecutive slices of it, so the canvas is
+    never cleared or rebuilt and points are drawn oldest first. Color, alpha
+    and gradient sharpness are vertex attributes and the gradient itself is
+    computed by the fragment shader, so there are no textures to create or
+    bind. Meshes are pooled and reused across frames; spare ones are emptied
+    rather than removed.
+
+    Add self.context to a canvas once and call update every frame.
+    """
+
+    def __init__(self, capacity=4096):
+        """
+        Initialize the renderer with an empty Mesh pool.
+
+        Args:
+            capacity (int): Initial number of quads in the vertex buffer, doubled when full
+        """
+        self.context = RenderContext(use_parent_projection=True, use_parent_modelview=True)
+        self.context.shader.vs = VERTEX_SHADER
+        self.context.shader.fs = FRAGMENT_SHADER
+        if not self.context.shader.success:
+            print("Error compiling the mesh renderer shader")
+
+        self._meshes = []
+        self._used = 0
+        self._vertices = self._allocate(capacity)
+
+        # Two triangles per quad; the same prefix serves every Mesh
+        quads = np.arange(MAX_QUADS_PER_MESH, dtype=np.uint32)[:, np.newaxis] * 4
+        self._indices = (quads + np.array([0, 1, 2, 2, 3, 0], dtype=np.uint32)).astype(np.uint16).ravel()
+
+    @staticmethod
+    def _allocate(capacity):
+        """Create a vertex buffer with the corner coordinates already filled in."""
+        vertices = np.empty((capacity, 4, FLOATS_PER_VERTEX), dtype=np.float32)
+        vertices[:, :, 2] = CORNER_X * 2
+        vertices[:, :, 3] = CORNER_Y * 2
+        return vertices
+
+    def _mesh(self, index):
+        """Get a pooled Mesh by index, creating it when the pool is too small."""
+        if index == len(self._meshes):
+            mesh = Mesh(fmt=VERTEX_FORMAT, mode='triangles')
+            self.context.add(mesh)
+            self._meshes.append(mesh)
+        return self._meshes[index]
+
+    def update(self, x, y, size, rgb, alpha, sharpness):
+        """
+        Rewrite the meshes for this frame's points, drawn in the given order.
+
+        Args:
+            x (np.ndarray): Center x of each point
+            y (np.ndarray): Center y of each point
+            size (np.ndarray): Diameter of each point
+            rgb (np.ndarray): Color of each point, shape (n, 3), 0-255
+            alpha (np.ndarray): Alpha at the center of each point, 0-255
+            sharpness (float or np.ndarray): Gradient falloff exponent
+        """
+        count = len(x)
+        if count > len(self._vertices):
+            capacity = len(self._vertices)
+            while capacity < count:
+                capacity *= 2
+            self._vertices = self._allocate(capacity)
+
+        size = np.asarray(size, dtype=np.float32)[:, np.newaxis]
+        vertices = self._vertices[:count]
+        vertices[:, :, 0] = np.asarray(x, dtype=np.float32)[:, np.newaxis] + size * CORNER_X
+        vertices[:, :, 1] = np.asarray(y, dtype=np.float32)[:, np.newaxis] + size * CORNER_Y
+        vertices[:, :, 4:7] = (rgb * np.float32(1 / 255))[:, np.newaxis, :]
+        vertices[:, :, 7] = (alpha * np.float32(1 / 255))[:, np.newaxis]
+        vertices[:, :, 8] = np.broadcast_to(np.asarray(sharpness, dtype=np.float32), (count,))[:, np.newaxis]
+
+        # Point each Mesh at its slice of the buffer
+        used = 0
+        for start in range(0, count, MAX_QUADS_PER_MESH):
+            quads = min(MAX_QUADS_PER_MESH, count - start)
+            mesh = self._mesh(used)
+            mesh.vertices = vertices[start:start + quads].reshape(-1)
+            mesh.indices = self._indices[:quads * 6]
+            used += 1
+
+        # Empty the meshes left over from busier frames
+        for mesh in self._meshes[used:self._used]:
+            mesh.vertices = self._vertices[:0].reshape(-1)
+            mesh.indices = self._indices[:0]
+        self._used = used
@@ -1,8 +1,10 @@
 import random
 import math
+import numpy as np
 
 from lib.SpingleColors import SpingleColors
 from lib.PolarMotion import PolarMotion
+from lib.TrailEmission import emit_trail_points
 
 class OrbitGroup:
     """
@@ -56,12 +58,11 @@ class OrbitGroup:
         self.y = 1
         
         # Initialize colors
-        self.colors = SpingleColors()
+        self.colors = SpingleColors.shared()
         self.palette_index = random.randint(0, self.colors.numPatterns() - 1)
         self.color_transition = 0
         
         self.creation_time = 0
-        self._last_trail_time = 0
         
         # Generate variations with improved distribution
         self.generate_variations()
@@ -168,6 +169,7 @@ class OrbitGroup:
                 'active': True
             }
             self.circles.append(circle)
+        self.reset_trail_positions()
     
     def calculate_circle_size(self, circle):
         """Calculate current circle size with all factors applied."""
@@ -256,11 +258,40 @@ class OrbitGroup:
             circle['motion'].radial_acceleration = 0
             circle['motion'].angular_acceleration = 0
             
+    def reset_trail_positions(self):
+        """Forget the last trail point of every circle, e.g. after clearing trails."""
+        self.last_trail_x = np.full(len(self.circles), np.nan)
+        self.last_trail_y = np.full(len(self.circles), np.nan)
+        
+        # Polar positions before the latest group_update, None until the first one
+        self.previous_radius = None
+        self.previous_theta = None
+    
+    def get_interpolated_positions(self, alpha, screen_center):
+        """
+        Get circle positions blended between the previous and the latest update.
+        
+        Args:
+            alpha (float): 0 for the previous positions, 1 for the latest ones
+            screen_center (tuple): Origin of the polar coordinates
+            
+        Returns:
+            tuple: (xs, ys) arrays, one entry per circle
+        """
+        radius = np.array([circle['motion'].radius for circle in self.circles])
+        theta = np.array([circle['motion'].theta for circle in self.circles])
+        if alpha < 1 and self.previous_radius is not None:
+            # Take the short way around when theta wrapped past 2 pi
+            delta = (theta - self.previous_theta + math.pi) % (2 * math.pi) - math.pi
+            radius = self.previous_radius + (radius - self.previous_radius) * alpha
+            theta = self.previous_theta + delta * alpha
+        return (screen_center[0] + radius * np.cos(theta),
+                screen_center[1] + radius * np.sin(theta))
+
     def group_update(self, dt, current_time, space_factor, screen_center):
         """Optimized circle updating."""
         # Pre-calculate common values
         screen_center = self.center
-        should_add_trail = current_time - self._last_trail_time >= 0.01 * space_factor # Limit trail frequency
         
         # Batch update circles
         current_size = self.calculate_circle_size(self.circles[0])
@@ -269,7 +300,11 @@ class OrbitGroup:
             self.circles[0]['color_index'],
             self.color_transition
         )
-        texture = None # self.get_texture()
+        self.previous_radius = np.array([circle['motion'].radius for circle in self.circles])
+        self.previous_theta = np.array([circle['motion'].theta for circle in self.circles])
+        
+        xs = []
+        ys = []
         for circle in self.circles:
             # Update motion
             circle['motion'].update(dt)
@@ -278,17 +313,24 @@ class OrbitGroup:
             if not self.is_mouse_group:
                 circle['time_offset'] += dt
             
-            # Only add trail points periodically
-            if self.is_circle_visible and should_add_trail:
-                x, y = self.get_circle_cartesian_pos(circle, screen_center)
-                
-                self.trail_store.add_point(
-                    x=x,
-                    y=y,
-                    color=color,
-                    size=current_size,
-                    group_id=self.group_id,
-                    creation_time=current_time,
-                    texture=texture
-                )
-            self._last_trail_time  = current_time
\ No newline at end of file
+            x, y = self.get_circle_cartesian_pos(circle, screen_center)
+            xs.append(x)
+            ys.append(y)
+        
+        # Emit a point per size * space_factor travelled, filling in fast moves
+        _, px, py = emit_trail_points(xs, ys, self.last_trail_x, self.last_trail_y,
+                                      current_size * space_factor)
+        
+        # Trail points never move, so points emitted off screen would never be drawn
+        width, height = screen_center[0] * 2, screen_center[1] * 2
+        on_screen = ((px + current_size >= 0) & (px - current_size <= width) &
+                     (py + current_size >= 0) & (py - current_size <= height))
+        px, py = px[on_screen], py[on_screen]
+        self.trail_store.add_points(
+            x=px,
+            y=py,
+            color=color,
+            size=current_size,
+            group_id=self.group_id,
+            creation_time=current_time
+        )
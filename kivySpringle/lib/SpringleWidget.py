@@ -6,7 +6,9 @@ from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from kivy.metrics import dp
 
+from lib.FixedTimestep import FixedTimestep
 from lib.KivySpingleCircle import KivySpingleCircle
+from lib.MeshRenderer import MeshRenderer
 from lib.SpringleParams import SpringleParams
 from lib.TextOverlay import TextOverlay
 
@@ -37,6 +39,10 @@ class SpringleWidget(MDWidget):
         self.HEIGHT = 600
         self._init_circle_system(self.WIDTH, self.HEIGHT) # initial size, resized soon after
         
+        # Trails are drawn by persistent meshes that are rewritten every frame
+        self.renderer = MeshRenderer()
+        self.canvas.add(self.renderer.context)
+        
         # Restore parameters
         self.params.validate()
         
@@ -69,6 +75,9 @@ class SpringleWidget(MDWidget):
         self.paused = False
         self.auto_generate = True
         
+        # Simulate at a fixed 60Hz whatever rate the clock actually fires at
+        self.timestep = FixedTimestep(60)
+        
         # Start update loop
         Clock.schedule_interval(self.widget_update, 1.0/120.0)
     
@@ -240,6 +249,7 @@ class SpringleWidget(MDWidget):
     def set_background_color(self, color):
         """Set the background color"""
         self.background_color = color
+        self._update_background()
         
     def _update_background(self, *args):
         """Update background rectangle"""
@@ -259,15 +269,16 @@ class SpringleWidget(MDWidget):
         # if self.current_touch:
         #     self.params.mouse_pos = self.current_touch.pos
         
-        # Update circle system
-        self.circle_system.kivy_circle_update(1/60, self.params)
+        # Update circle system in fixed steps covering the elapsed time
+        for _ in range(self.timestep.advance(dt)):
+            self.circle_system.kivy_circle_update(self.timestep.step, self.params)
+        
+        # Draw the current circles part way to the next step so motion stays
+        # smooth when the clock fires faster than the simulation rate
+        self.circle_system.render_alpha = self.timestep.alpha
         
-        # Trigger a redraw
-        self.canvas.clear()
-        with self.canvas:
-            self._update_background()
-            # Draw circles and trails
-            self.circle_system.draw(
-                self.canvas,
-                self.params.gradient_sharpness
-            )
\ No newline at end of file
+        # Rewrite the trail meshes; the canvas itself is left in place
+        self.circle_system.draw(
+            self.renderer,
+            self.params.gradient_sharpness
+        )
\ No newline at end of file
@@ -0,0 +1,57 @@
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into fixed simulation steps.
+
+    Each frame the elapsed time is added to the accumulator and whole steps are
+    taken out of it; the remainder gives the interpolation factor between the
+    last two simulated states. Long frames are capped at max_steps so a stall
+    slows the simulation down instead of making it jump.
+    """
+
+    def __init__(self, rate=60, max_steps=5):
+        """
+        Initialize the timestep.
+
+        Args:
+            rate (float): Simulation steps per second
+            max_steps (int): Most steps run for a single frame; any time beyond
+                that is dropped
+        """
+        self.max_steps = max(1, int(max_steps))
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        """Change the simulation rate, keeping the fraction of a step already accumulated."""
+        fraction = self.alpha if hasattr(self, 'step') else 0.0
+        self.rate = max(1.0, float(rate))
+        self.step = 1.0 / self.rate
+        self.accumulator = fraction * self.step
+
+    def reset(self):
+        """Drop any accumulated time, e.g. after unpausing."""
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        """
+        Add a frame's elapsed time.
+
+        Args:
+            frame_dt (float): Seconds since the previous frame
+
+        Returns:
+            int: Number of steps of self.step seconds to simulate this frame
+        """
+        self.accumulator += max(0.0, frame_dt)
+        # Tolerance so a frame of exactly one step isn't lost to rounding
+        steps = int(self.accumulator / self.step + 1e-9)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step between the previous and the current state, 0 to 1."""
+        return min(1.0, self.accumulator / self.step)
@@ -0,0 +1,225 @@
+"""
+Offline frame exporter.
+
+Runs the simulation headlessly at a fixed timestep and renders the frames in a
+multiprocessing pool. Simulation stays in this process because each step
+depends on the previous one, but drawing a frame only needs that frame's
+drawable columns, so frames are rendered in parallel and written in order.
+
+Usage:
+    python -m lib.FrameExporter data/exports/clip --duration 30
+    python -m lib.FrameExporter clip.gif --duration 10 --fps 25 --scale 0.5
+"""
+
+import argparse
+import io
+import itertools
+import multiprocessing
+import os
+import random
+from collections import deque
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import DEFAULT_SETTINGS, SpringleParams
+
+# Per-worker render state, set up once by _init_worker
+_worker = {}
+
+
+def simulate(params, size, frame_count, fps, seed, warmup_frames=0,
+             spawn_cooldown=DEFAULT_SETTINGS['spawn_cooldown'],
+             color_transition_speed=DEFAULT_SETTINGS['color_transition_speed']):
+    """
+    Run the simulation and yield the drawable columns of each frame.
+
+    Args:
+        params (SpringleParams): Simulation parameters
+        size (tuple): (width, height) of the scene
+        frame_count (int): Number of frames to produce
+        fps (int): Frames per second, the timestep is 1 / fps
+        seed (int): RNG seed applied before the circle system is created
+        warmup_frames (int): Frames simulated before the first snapshot
+        spawn_cooldown (float): Seconds between automatic groups
+        color_transition_speed (float): Palette transition speed
+
+    Yields:
+        dict: Columns from SpringleCircle.get_drawable_columns
+    """
+    random.seed(seed)
+    circle_system = SpringleCircle(
+        params.min_circles, params.max_circles,
+        params.radial_velocity, params.angular_velocity,
+        params.radial_acceleration, params.angular_acceleration,
+        params.base_size, size[0], size[1]
+    )
+    circle_system.set_max_groups(params.max_groups)
+    circle_system.spawn_cooldown_start = spawn_cooldown
+    circle_system.spawn_cooldown_current = spawn_cooldown
+    circle_system.color_transition_speed = color_transition_speed
+
+    dt = 1.0 / fps
+    for _ in range(warmup_frames):
+        circle_system.update(dt, params)
+    for _ in range(frame_count):
+        circle_system.update(dt, params)
+        yield circle_system.get_drawable_columns(params.max_alpha)
+
+
+def _init_worker(size, background, output_size, image_format):
+    """Create the per-process surface and gradient cache."""
+    # No pygame.init(): SDL would turn SIGTERM into a quit event and
+    # Pool.terminate could no longer stop the worker
+    _worker['screen'] = pygame.Surface(size)
+    _worker['background'] = background
+    _worker['output_size'] = output_size
+    _worker['format'] = image_format
+    # Only used for its gradient sprite cache and draw_columns
+    _worker['renderer'] = SpringleCircle(1, 1, 0, 0, 0, 0, 1, size[0], size[1])
+
+
+def _render_frame(columns):
+    """
+    Draw one frame in a worker.
+
+    Args:
+        columns (dict): Drawable columns of the frame
+
+    Returns:
+        bytes: Encoded PNG, or raw RGB pixels for GIF output
+    """
+    screen = _worker['screen']
+    screen.fill(_worker['background'])
+    _worker['renderer'].draw_columns(screen, columns)
+
+    if screen.get_size() != _worker['output_size']:
+        screen = pygame.transform.smoothscale(screen, _worker['output_size'])
+
+    if _worker['format'] == 'gif':
+        return pygame.image.tobytes(screen, 'RGB')
+
+    buffer = io.BytesIO()
+    pygame.image.save(screen, buffer, 'frame.png')
+    return buffer.getvalue()
+
+
+def render_frames(snapshots, size, background, output_size, image_format, workers):
+    """
+    Render snapshots in a process pool, yielding results in frame order.
+
+    At most a few frames per worker are in flight, so the simulation never
+    runs far ahead of the encoder and memory stays bounded.
+    """
+    with multiprocessing.Pool(workers, _init_worker,
+                              (size, background, output_size, image_format)) as pool:
+        pending = deque()
+        for columns in snapshots:
+            pending.append(pool.apply_async(_render_frame, (columns,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+        pool.close()
+        pool.join()
+
+
+def write_png_sequence(frames, directory):
+    """Write encoded PNG frames to directory as frame_00000.png, ..."""
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, data in enumerate(frames, 1):
+        with open(os.path.join(directory, f'frame_{count - 1:05d}.png'), 'wb') as f:
+            f.write(data)
+    return count
+
+
+def write_gif(frames, path, output_size, fps):
+    """
+    Encode raw RGB frames into an animated GIF as they arrive. Requires Pillow.
+
+    Each frame gets its own palette and is appended to the file as soon as it
+    is encoded, so memory is bounded by the frames in flight rather than the
+    length of the clip.
+    """
+    try:
+        from PIL import GifImagePlugin, Image
+    except ImportError:
+        print("GIF export requires Pillow: pip install pillow")
+        return 0
+
+    images = (Image.frombytes('RGB', output_size, data).quantize() for data in frames)
+    first = next(images, None)
+    if first is None:
+        return 0
+
+    duration = round(1000 / fps)
+    count = 0
+    with open(path, 'wb') as f:
+        header, _ = GifImagePlugin.getheader(first, info={'loop': 0})
+        f.writelines(header)
+        for count, image in enumerate(itertools.chain([first], images), 1):
+            f.writelines(GifImagePlugin.getdata(image, duration=duration,
+                                                include_color_table=True))
+            f.flush()
+        f.write(b';')  # Trailer
+    return count
+
+
+def parse_color(value):
+    """Parse an 'r,g,b' argument."""
+    try:
+        r, g, b = (int(c) for c in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected r,g,b but got '{value}'")
+    return (r, g, b)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export Springle animation frames')
+    parser.add_argument('output', help='Directory for a PNG sequence, or a .gif file')
+    parser.add_argument('--duration', type=float, default=30.0, help='Clip length in seconds')
+    parser.add_argument('--fps', type=int, default=30, help='Frames per second')
+    parser.add_argument('--width', type=int, default=1080, help='Scene width')
+    parser.add_argument('--height', type=int, default=1080, help='Scene height')
+    parser.add_argument('--scale', type=float, default=1.0, help='Output scale factor')
+    parser.add_argument('--seed', type=int, default=0, help='RNG seed')
+    parser.add_argument('--warmup', type=float, default=0.0,
+                        help='Seconds simulated before the first exported frame')
+    parser.add_argument('--fade-duration', type=float, default=DEFAULT_SETTINGS['fade_duration'],
+                        help='Trail fade in seconds')
+    parser.add_argument('--max-groups', type=int, default=DEFAULT_SETTINGS['max_groups'],
+                        help='Maximum active groups')
+    parser.add_argument('--background', type=parse_color, default=(185, 150, 234),
+                        help='Background color as r,g,b')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Render processes')
+    args = parser.parse_args(argv)
+
+    image_format = 'gif' if args.output.lower().endswith('.gif') else 'png'
+    size = (args.width, args.height)
+    output_size = (max(1, round(args.width * args.scale)), max(1, round(args.height * args.scale)))
+
+    params = SpringleParams.from_settings()
+    params.fade_duration = args.fade_duration
+    params.max_groups = args.max_groups
+
+    warmup_frames = round(args.warmup * args.fps)
+    frame_count = round(args.duration * args.fps)
+    snapshots = simulate(params, size, frame_count, args.fps, args.seed, warmup_frames)
+
+    frames = render_frames(snapshots, size, args.background, output_size,
+                           image_format, max(1, args.workers))
+    if image_format == 'gif':
+        written = write_gif(frames, args.output, output_size, args.fps)
+    else:
+        written = write_png_sequence(frames, args.output)
+    if written:
+        print(f"Exported {written} frames to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import math
 
 from lib.SpingleColors import SpingleColors
 from lib.PolarMotion import PolarMotion
+from lib.ParticleEngine import EngineMotion
 
 class OrbitGroup:
     """
@@ -21,7 +22,7 @@ class OrbitGroup:
     def __init__(self, min_circles, max_circles, radius, base_size, 
                  radial_velocity, angular_velocity,
                  radial_acceleration, angular_acceleration,  
-                 is_mouse_group=False):
+                 is_mouse_group=False, engine=None):
         """
         Initialize orbit group with parameter validation.
         
@@ -35,6 +36,8 @@ class OrbitGroup:
             radial_acceleration (float): Initial radial acceleration
             angular_acceleration (float): Initial angular acceleration
             is_mouse_group (bool): Whether this group is controlled by mouse
+            engine (ParticleEngine): Shared motion engine; circles use standalone
+                PolarMotion objects when None
         """
         # Validate parameters
         self.validate_parameters(min_circles, max_circles, radius, base_size)
@@ -45,9 +48,13 @@ class OrbitGroup:
         
         self.radius = radius
         self.active = True
+        self.expiry_time = None  # Predicted simulation time of leaving the screen
+        self.predicted_acceleration = None  # Radial acceleration the prediction assumed
+        self.engine = engine
+        self.slots = None
         
         # Initialize colors
-        self.colors = SpingleColors()
+        self.colors = SpingleColors.shared()
         self.palette_index = random.randint(0, self.colors.numPatterns() - 1)
         self.color_transition = 0
         
@@ -128,9 +135,14 @@ class OrbitGroup:
         self.circles = []
         angle_step = 2 * math.pi / num_circles
         
+        # Reserve one engine slot per circle, freed when the group is collected
+        if self.engine is not None:
+            self.slots = self.engine.allocate(num_circles)
+            self.engine.bind_owner(self, self.slots)
+        
         for i in range(num_circles):
             # Create motion with validated parameters
-            motion = PolarMotion(
+            motion_kwargs = dict(
                 radius=radius,
                 theta=angle_step * i,
                 radial_velocity=0 if self.is_mouse_group else 
@@ -142,14 +154,16 @@ class OrbitGroup:
                 angular_acceleration=0 if self.is_mouse_group else 
                                      angular_acceleration * self.at_variation
             )
+            if self.engine is not None:
+                motion = EngineMotion(self.engine, self.slots[i], **motion_kwargs)
+            else:
+                motion = PolarMotion(**motion_kwargs)
             
             # Create circle with validated parameters
             circle = {
                 'motion': motion,
                 'color_index': 0,
-                'trail': [],
                 'time_offset': 0 if self.is_mouse_group else self.time_offset,
-                'last_trail_pos': None,
                 'size_variation': self.size_variation,
                 'base_size': base_size,
                 'active': True
@@ -163,14 +177,16 @@ class OrbitGroup:
         
         # Filter out inactive circles
         active_circles = []
-        for circle in self.circles:
+        active_slots = []
+        for i, circle in enumerate(self.circles):
             if math.fabs(circle['motion'].radius) <= visibility_threshold:
                 active_circles.append(circle)
-            else:
-                # Clear memory used by trail
-                circle['trail'].clear()
+                active_slots.append(i)
         
         self.circles = active_circles
+        # Engine slots stay reserved until the group is collected
+        if self.slots is not None:
+            self.slots = self.slots[active_slots]
         # Update group active status
         self.active = len(self.circles) > 0
     
@@ -184,6 +200,13 @@ class OrbitGroup:
             
     def update_circle_acceleration(self, radial, angular):
         """Update accelerations with proper scaling."""
+        if self.engine is not None:
+            if not self.is_mouse_group:
+                self.engine.set_accelerations(self.slots,
+                                              radial * self.ar_variation,
+                                              angular * self.at_variation)
+            return
+            
         for circle in self.circles:
             if not self.is_mouse_group:
                 circle['motion'].radial_acceleration = radial * self.ar_variation
@@ -192,8 +215,9 @@ class OrbitGroup:
     def update_circle_positions(self, dt):
         """Update positions with time-based variations."""
         for circle in self.circles:
-            # Update motion
-            circle['motion'].update(dt)
+            # Engine-backed motion is advanced in bulk by ParticleEngine.step
+            if self.engine is None:
+                circle['motion'].update(dt)
             
             # Update time offset for variation calculations
             if not self.is_mouse_group:
@@ -221,6 +245,27 @@ class OrbitGroup:
             
         return math.fabs(self.circles[0]['motion'].radius) <= visible_radius
     
+    def predict_lifetime(self, screen_size, dt=1/60):
+        """
+        Predict how long until is_circle_visible turns False, assuming the
+        current radial acceleration stays constant.
+        
+        Args:
+            screen_size (tuple): (width, height) of the screen
+            dt (float): Expected time step
+            
+        Returns:
+            float: Seconds until the group leaves, math.inf if it never does
+        """
+        if len(self.circles) == 0:
+            return 0.0
+        
+        motion = self.circles[0]['motion']
+        self.predicted_acceleration = motion.radial_acceleration
+        visible_radius = max(screen_size[0], screen_size[1]) * self.VISIBILITY_MARGIN
+        return PolarMotion.time_to_leave(motion.radius, motion.radial_velocity,
+                                         motion.radial_acceleration, visible_radius, dt)
+    
     def get_circle_cartesian_pos(self, circle, screen_center):
         """Get circle position with validation."""
         if not circle or not screen_center:
@@ -0,0 +1,257 @@
+import math
+import weakref
+
+import numpy as np
+
+from lib.PolarMotion import PolarMotion
+
+
+class ParticleEngine:
+    """
+    Structure-of-arrays store for the polar motion of every circle in every group.
+    Circles own a slot in the shared arrays and the whole population is advanced
+    with a single vectorized step per frame instead of one PolarMotion.update call
+    per circle.
+    """
+
+    # Per-slot motion state, all stored as float64 to match PolarMotion exactly
+    FIELDS = ('radius', 'theta', 'radial_velocity', 'angular_velocity',
+              'radial_acceleration', 'angular_acceleration')
+
+    # Positions before the latest step, used to interpolate between steps.
+    # NaN until a slot has been stepped once.
+    PREVIOUS_FIELDS = ('previous_radius', 'previous_theta')
+
+    # Screen position of each slot's last emitted trail point, NaN if none
+    TRAIL_FIELDS = ('trail_x', 'trail_y')
+
+    # Fields that start out as NaN rather than zero
+    UNSET_FIELDS = PREVIOUS_FIELDS + TRAIL_FIELDS
+
+    # Number of trail points each slot has emitted
+    COUNTER_FIELDS = ('trail_count',)
+
+    def __init__(self, capacity=256):
+        """
+        Initialize the engine with pre-allocated slot arrays.
+
+        Args:
+            capacity (int): Initial number of slots, grown on demand
+        """
+        self.capacity = max(1, int(capacity))
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        for name in self.UNSET_FIELDS:
+            setattr(self, name, np.full(self.capacity, np.nan))
+        for name in self.COUNTER_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.int64))
+        self.alive = np.zeros(self.capacity, dtype=bool)
+
+        # Free slots kept sorted high-to-low so pop() hands out the lowest index
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self._high_water = 0  # One past the highest live slot
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self._high_water]))
+
+    def _grow(self, min_capacity):
+        """Grow all arrays to at least min_capacity slots."""
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+
+        for name in self.FIELDS + self.UNSET_FIELDS + self.COUNTER_FIELDS + ('alive',):
+            old = getattr(self, name)
+            new = np.full(new_capacity, np.nan) if name in self.UNSET_FIELDS \
+                else np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+
+        self._free = list(range(new_capacity - 1, self.capacity - 1, -1)) + self._free
+        self.capacity = new_capacity
+
+    def allocate(self, count):
+        """
+        Reserve slots for a group of circles.
+
+        Args:
+            count (int): Number of slots needed
+
+        Returns:
+            np.ndarray: Slot indices, lowest first
+        """
+        if count > len(self._free):
+            self._grow(self.capacity + count)
+
+        slots = np.array([self._free.pop() for _ in range(count)], dtype=np.intp)
+        slots.sort()
+        for name in self.FIELDS:
+            getattr(self, name)[slots] = 0.0
+        for name in self.UNSET_FIELDS:
+            getattr(self, name)[slots] = np.nan
+        for name in self.COUNTER_FIELDS:
+            getattr(self, name)[slots] = 0
+        self.alive[slots] = True
+        if len(slots):
+            self._high_water = max(self._high_water, int(slots[-1]) + 1)
+        return slots
+
+    def release(self, slots):
+        """Return slots to the free list."""
+        slots = [int(s) for s in slots if self.alive[s]]
+        if not slots:
+            return
+        self.alive[slots] = False
+        self._free.extend(slots)
+        self._free.sort(reverse=True)
+
+        # Shrink the stepped range when the top slots are released
+        alive = np.flatnonzero(self.alive[:self._high_water])
+        self._high_water = int(alive[-1]) + 1 if len(alive) else 0
+
+    @staticmethod
+    def _clamp_radial_velocity(value):
+        """Vectorized PolarMotion._clamp_radial_velocity, including the (-1, 1) -> 1 snap."""
+        clamped = np.clip(value, PolarMotion.MIN_RADIAL_VELOCITY, PolarMotion.MAX_RADIAL_VELOCITY)
+        return np.where((value > -1) & (value < 1), 1.0, clamped)
+
+    @staticmethod
+    def _clamp_angular_velocity(value):
+        """Vectorized PolarMotion._clamp_angular_velocity, including the (-0.05, 0.05) snap."""
+        clamped = np.clip(value, PolarMotion.MIN_ANGULAR_VELOCITY, PolarMotion.MAX_ANGULAR_VELOCITY)
+        return np.where((value > -0.05) & (value < 0.05), 0.05, clamped)
+
+    def step(self, dt):
+        """
+        Advance every allocated slot by dt using the same mid-point integration
+        and clamping rules as PolarMotion.update.
+
+        Args:
+            dt (float): Time step in seconds
+        """
+        n = self._high_water
+        if n == 0:
+            return
+
+        radius = self.radius[:n]
+        theta = self.theta[:n]
+        radial_velocity = self.radial_velocity[:n]
+        angular_velocity = self.angular_velocity[:n]
+        radial_acceleration = self.radial_acceleration[:n]
+        angular_acceleration = self.angular_acceleration[:n]
+
+        self.previous_radius[:n] = radius
+        self.previous_theta[:n] = theta
+
+        # Mid-point velocities, evaluated in the same order as PolarMotion.update
+        mid_radial_velocity = self._clamp_radial_velocity(
+            radial_velocity + radial_acceleration * dt / 2)
+        mid_angular_velocity = self._clamp_angular_velocity(
+            angular_velocity + angular_acceleration * dt / 2)
+
+        # Final velocities
+        radial_velocity[:] = self._clamp_radial_velocity(
+            radial_velocity + radial_acceleration * dt)
+        angular_velocity[:] = self._clamp_angular_velocity(
+            angular_velocity + angular_acceleration * dt)
+
+        # Positions from the mid-point velocities
+        np.clip(radius + mid_radial_velocity * dt,
+                PolarMotion.MIN_RADIUS, PolarMotion.MAX_RADIUS, out=radius)
+        np.mod(theta + mid_angular_velocity * dt, 2 * math.pi, out=theta)
+
+    def to_cartesian(self, slots, origin_x=0, origin_y=0):
+        """
+        Convert the given slots to Cartesian coordinates.
+
+        Args:
+            slots (np.ndarray): Slot indices
+            origin_x (float): x coordinate of the origin
+            origin_y (float): y coordinate of the origin
+
+        Returns:
+            tuple: (xs, ys) arrays
+        """
+        radius = self.radius[slots]
+        theta = self.theta[slots]
+        return origin_x + radius * np.cos(theta), origin_y + radius * np.sin(theta)
+
+    def interpolate(self, slot, alpha):
+        """
+        Blend a slot's position between the previous and the latest step.
+
+        Slots that have not been stepped yet, e.g. groups created since the
+        last step, report their current position.
+
+        Args:
+            slot (int): Slot index
+            alpha (float): 0 for the previous position, 1 for the current one
+
+        Returns:
+            tuple: (radius, theta)
+        """
+        radius = float(self.radius[slot])
+        theta = float(self.theta[slot])
+        previous_radius = float(self.previous_radius[slot])
+        if alpha >= 1 or math.isnan(previous_radius):
+            return radius, theta
+
+        # Take the short way around when theta wrapped past 2 pi
+        previous_theta = float(self.previous_theta[slot])
+        delta = (theta - previous_theta + math.pi) % (2 * math.pi) - math.pi
+        return (previous_radius + (radius - previous_radius) * alpha,
+                previous_theta + delta * alpha)
+
+    def set_accelerations(self, slots, radial, angular):
+        """Set the accelerations of the given slots, clamped like PolarMotion."""
+        self.radial_acceleration[slots] = max(PolarMotion.MIN_RADIAL_ACCELERATION,
+                                              min(PolarMotion.MAX_RADIAL_ACCELERATION, radial))
+        self.angular_acceleration[slots] = max(PolarMotion.MIN_ANGULAR_ACCELERATION,
+                                               min(PolarMotion.MAX_ANGULAR_ACCELERATION, angular))
+
+    def bind_owner(self, owner, slots):
+        """Release the slots automatically once owner is garbage collected."""
+        weakref.finalize(owner, self.release, slots)
+
+
+def _slot_property(name):
+    """Build a property that reads and writes one slot of an engine array."""
+    def getter(self):
+        return float(getattr(self._engine, name)[self._slot])
+
+    def setter(self, value):
+        getattr(self._engine, name)[self._slot] = value
+
+    return property(getter, setter)
+
+
+class EngineMotion(PolarMotion):
+    """
+    PolarMotion whose state lives in a ParticleEngine slot.
+    Keeps the PolarMotion API (properties, clamping, release handling) so callers
+    holding circle['motion'] are unaffected, while ParticleEngine.step advances it.
+    """
+
+    _radius = _slot_property('radius')
+    _theta = _slot_property('theta')
+    _radial_velocity = _slot_property('radial_velocity')
+    _angular_velocity = _slot_property('angular_velocity')
+    _radial_acceleration = _slot_property('radial_acceleration')
+    _angular_acceleration = _slot_property('angular_acceleration')
+
+    def __init__(self, engine, slot, **kwargs):
+        """
+        Initialize motion bound to an engine slot.
+
+        Args:
+            engine (ParticleEngine): Engine owning the state arrays
+            slot (int): Index of this circle's slot
+            **kwargs: Initial PolarMotion parameters
+        """
+        self._engine = engine
+        self._slot = int(slot)
+        super().__init__(**kwargs)
+
+    @property
+    def slot(self):
+        return self._slot
@@ -165,6 +165,76 @@ class PolarMotion:
             self._theta + mid_angular_velocity * dt
         )
     
+    @staticmethod
+    def _first_crossing(radius, velocity, acceleration, limit, duration):
+        """Earliest t in [0, duration] where radius + v*t + a*t²/2 reaches ±limit, or None."""
+        times = []
+        for target in (limit, -limit):
+            c = radius - target
+            if acceleration == 0:
+                if velocity != 0:
+                    times.append(-c / velocity)
+                continue
+            discriminant = velocity * velocity - 2 * acceleration * c
+            if discriminant < 0:
+                continue
+            root = math.sqrt(discriminant)
+            times.extend(((-velocity - root) / acceleration, (-velocity + root) / acceleration))
+        times = [t for t in times if 0 <= t <= duration]
+        return min(times) if times else None
+    
+    @classmethod
+    def time_to_leave(cls, radius, radial_velocity, radial_acceleration, limit, dt=1/60):
+        """
+        Predict when |radius| first reaches limit without stepping the motion.
+        
+        Follows the same clamping as update(): velocity saturates at the
+        radial limits and the (-1, 1) dead zone snaps to 1. Decelerating toward
+        the dead zone leaves the velocity stuck at 1 unless one step of the
+        acceleration is enough to jump across it.
+        
+        Args:
+            radius (float): Current radius
+            radial_velocity (float): Current radial velocity
+            radial_acceleration (float): Constant radial acceleration
+            limit (float): Radius magnitude to reach
+            dt (float): Expected time step, used only for the dead zone case
+            
+        Returns:
+            float: Seconds until the limit is reached, math.inf if never
+        """
+        if abs(radius) >= limit:
+            return 0.0
+        if limit > cls.MAX_RADIUS:
+            return math.inf  # Radius is clamped before it gets there
+        
+        elapsed = 0.0
+        v, a = radial_velocity, radial_acceleration
+        # At most: ramp, dead zone jump, ramp, cruise
+        for _ in range(4):
+            # Velocity where the current constant-acceleration segment ends
+            if a > 0:
+                v_end = -1 if v < -1 else cls.MAX_RADIAL_VELOCITY
+            elif a < 0:
+                v_end = 1 if v >= 1 and a * dt > -2 else cls.MIN_RADIAL_VELOCITY
+            else:
+                v_end = v
+            duration = (v_end - v) / a if a != 0 else math.inf
+            
+            t = cls._first_crossing(radius, v, a, limit, duration)
+            if t is not None:
+                return elapsed + t
+            if duration == math.inf:
+                return math.inf
+            
+            radius += v * duration + a * duration * duration / 2
+            elapsed += duration
+            if v_end == -1 and a > 0:
+                v = 1  # Snapped across the dead zone, keeps accelerating
+            else:
+                v, a = v_end, 0.0  # Saturated or stuck at 1
+        return math.inf
+    
     def to_cartesian(self, origin_x=0, origin_y=0):
         """
         Convert polar coordinates to Cartesian coordinates.
@@ -0,0 +1,112 @@
+import numpy as np
+
+# Quality levels from best to cheapest, applied with SpringleCircle.set_quality.
+# Each level only adds savings on top of the previous one.
+QUALITY_LEVELS = (
+    {'size_step': 2, 'alpha_step': 16, 'gradient_steps': 15, 'thin_after': None, 'max_trail_points': None},
+    {'size_step': 4, 'alpha_step': 32, 'gradient_steps': 15, 'thin_after': None, 'max_trail_points': None},
+    {'size_step': 4, 'alpha_step': 32, 'gradient_steps': 8, 'thin_after': None, 'max_trail_points': None},
+    {'size_step': 4, 'alpha_step': 32, 'gradient_steps': 8, 'thin_after': 0.3, 'max_trail_points': None},
+    {'size_step': 6, 'alpha_step': 48, 'gradient_steps': 5, 'thin_after': 0.2, 'max_trail_points': 20000},
+    {'size_step': 8, 'alpha_step': 64, 'gradient_steps': 4, 'thin_after': 0.1, 'max_trail_points': 8000},
+)
+
+
+class QualityGovernor:
+    """
+    Holds a target frame rate by stepping SpringleCircle quality down when
+    frames blow their time budget and back up when there is headroom.
+
+    Frame work times are collected over a window of frames. A window whose
+    90th percentile exceeds the budget lowers the quality one level; several
+    consecutive windows well under budget raise it again. Adjustments are
+    spaced by a cooldown so each level gets a fair measurement, and every
+    change is printed and kept in self.history.
+    """
+
+    def __init__(self, circle_system, target_fps=60, levels=QUALITY_LEVELS, window=30,
+                 restore_ratio=0.6, restore_windows=3, cooldown=2.0):
+        """
+        Initialize the governor at the best quality level.
+
+        Args:
+            circle_system (SpringleCircle): System whose quality is adjusted
+            target_fps (float): Frame rate to hold
+            levels (tuple): Keyword arguments for set_quality, best first
+            window (int): Frames per measurement
+            restore_ratio (float): Fraction of the budget a window must stay
+                under to count towards restoring quality
+            restore_windows (int): Consecutive windows under restore_ratio
+                needed before quality goes back up
+            cooldown (float): Seconds after an adjustment before the next one
+        """
+        self.circle_system = circle_system
+        self.budget = 1.0 / target_fps
+        self.levels = levels
+        self.window = window
+        self.restore_ratio = restore_ratio
+        self.restore_windows = restore_windows
+        self.cooldown = cooldown
+
+        self.level = 0
+        self.history = []  # (elapsed, old_level, new_level, p90_ms)
+        self.elapsed = 0.0
+        self._samples = []
+        self._quiet_windows = 0
+        self._last_change = -cooldown
+
+        circle_system.set_quality(**levels[0])
+
+    def update(self, work_time, frame_dt):
+        """
+        Record one frame.
+
+        Args:
+            work_time (float): Seconds spent updating and drawing the frame,
+                excluding any frame rate limiter sleep
+            frame_dt (float): Seconds since the previous frame
+        """
+        self.elapsed += frame_dt
+        self._samples.append(work_time)
+        if len(self._samples) < self.window:
+            return
+
+        p90 = float(np.percentile(self._samples, 90))
+        self._samples = []
+        if self.elapsed - self._last_change < self.cooldown:
+            return
+
+        if p90 > self.budget:
+            self._quiet_windows = 0
+            if self.level < len(self.levels) - 1:
+                self.set_level(self.level + 1, p90)
+        elif p90 < self.budget * self.restore_ratio:
+            self._quiet_windows += 1
+            if self._quiet_windows >= self.restore_windows and self.level > 0:
+                self.set_level(self.level - 1, p90)
+        else:
+            self._quiet_windows = 0
+
+    def set_level(self, level, p90=None):
+        """
+        Apply a quality level and log the change.
+
+        Args:
+            level (int): Index into self.levels, 0 being the best quality
+            p90 (float): Measured 90th percentile frame time that caused the change
+        """
+        level = max(0, min(len(self.levels) - 1, level))
+        if level == self.level:
+            return
+
+        old_level = self.level
+        self.level = level
+        self.circle_system.set_quality(**self.levels[level])
+        self._last_change = self.elapsed
+        self._quiet_windows = 0
+
+        p90_ms = p90 * 1000 if p90 is not None else None
+        self.history.append((self.elapsed, old_level, level, p90_ms))
+        direction = 'lowered' if level > old_level else 'raised'
+        measured = f" (p90 {p90_ms:.1f} ms, budget {self.budget * 1000:.1f} ms)" if p90_ms is not None else ''
+        print(f"Quality {direction} to level {level}{measured}: {self.levels[level]}")
@@ -0,0 +1,298 @@
+import argparse
+import cProfile
+import dataclasses
+import gzip
+import json
+import os
+import random
+import time
+import zlib
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+FORMAT_VERSION = 1
+
+# SpringleCircle attributes the app changes outside of update(), e.g. from sliders
+# or the quality governor
+SYSTEM_FIELDS = ('color_transition_speed', 'spawn_cooldown_start',
+                 'spawn_cooldown_current', 'max_groups', 'render_mode',
+                 'quality')
+
+# Frames between state checksums used to detect a diverging replay
+CHECK_INTERVAL = 60
+
+
+def _params_to_dict(params):
+    """Convert SpringleParams to JSON-compatible values."""
+    state = dataclasses.asdict(params)
+    state['mouse_pos'] = list(state['mouse_pos']) if state['mouse_pos'] else None
+    return state
+
+
+def _params_from_dict(state):
+    """Rebuild SpringleParams from recorded values."""
+    state = dict(state)
+    if state['mouse_pos'] is not None:
+        state['mouse_pos'] = tuple(state['mouse_pos'])
+    return SpringleParams(**state)
+
+
+def _system_state(circle_system):
+    """Get the recorded attributes of a circle system."""
+    return {name: getattr(circle_system, name) for name in SYSTEM_FIELDS}
+
+
+def state_checksum(circle_system):
+    """
+    Checksum the motion and trail state of a circle system.
+
+    Args:
+        circle_system (SpringleCircle): System to summarize
+
+    Returns:
+        int: CRC32 of the live engine slots and newest trail points
+    """
+    engine = circle_system.engine
+    n = engine._high_water
+    checksum = zlib.crc32(engine.radius[:n].tobytes())
+    checksum = zlib.crc32(engine.theta[:n].tobytes(), checksum)
+    trails = circle_system.trails
+    newest = trails.newest(64)
+    checksum = zlib.crc32(newest['x'].tobytes(), checksum)
+    checksum = zlib.crc32(newest['y'].tobytes(), checksum)
+    return zlib.crc32(f'{trails.total_appended},{len(circle_system.groups)}'.encode(), checksum)
+
+
+class SceneRecorder:
+    """
+    Logs everything that drives a SpringleCircle so a session can be replayed
+    exactly: the RNG seed, per-frame dt, SpringleParams and any attributes or
+    group actions applied from the UI between updates.
+
+    The file is gzipped JSON lines. The first line is a header; each following
+    line is one update and only stores values that changed since the previous one.
+    """
+
+    def __init__(self, path, seed, circle_args, circle_system):
+        """
+        Start a recording.
+
+        Args:
+            path (str): Output file, conventionally ending in .jsonl.gz
+            seed (int): Value passed to random.seed before circle_system was created
+            circle_args (tuple): Positional arguments used to create circle_system
+            circle_system (SpringleCircle): System being recorded
+        """
+        self.path = path
+        self.circle_system = circle_system
+        self.frame_count = 0
+        self._actions = []
+        self._last_params = {}
+        self._last_system = _system_state(circle_system)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._write({
+            'version': FORMAT_VERSION,
+            'seed': seed,
+            'circle_args': list(circle_args),
+            'system': self._last_system,
+        })
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def record_action(self, name):
+        """
+        Log a group action applied before the next update.
+
+        Args:
+            name (str): One of SceneReplayer.ACTIONS
+        """
+        self._actions.append(name)
+
+    def record_frame(self, dt, params):
+        """
+        Log one update. Call immediately before circle_system.update.
+
+        Args:
+            dt (float): Time step passed to update
+            params (SpringleParams): Parameters passed to update
+        """
+        record = {'dt': dt}
+
+        state = _params_to_dict(params)
+        changed = {k: v for k, v in state.items() if self._last_params.get(k, object()) != v}
+        if changed:
+            record['params'] = changed
+        self._last_params = state
+
+        system = _system_state(self.circle_system)
+        changed = {k: v for k, v in system.items() if self._last_system[k] != v}
+        if changed:
+            record['system'] = changed
+
+        if self._actions:
+            record['actions'] = self._actions
+            self._actions = []
+
+        self._write(record)
+
+    def end_frame(self):
+        """Note the state left by update. Call immediately after circle_system.update."""
+        self._last_system = _system_state(self.circle_system)
+        self.frame_count += 1
+        if self.frame_count % CHECK_INTERVAL == 0:
+            self._write({'check': state_checksum(self.circle_system)})
+
+    def close(self):
+        """Flush and close the recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            print(f"Recording saved: {self.path} ({self.frame_count} frames)")
+
+
+class SceneReplayer:
+    """
+    Drives a SpringleCircle from a SceneRecorder file, reproducing the
+    recorded session update for update.
+    """
+
+    # Recorded action name -> SpringleCircle call
+    ACTIONS = {
+        'new_group': lambda system, params: system.create_group(params),
+        'clear_groups': lambda system, params: system.clear_groups(params),
+        'clear_trails': lambda system, params: system.clear_trails(),
+    }
+
+    def __init__(self, path):
+        """
+        Load a recording.
+
+        Args:
+            path (str): File written by SceneRecorder
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            self.header = json.loads(f.readline())
+            self.records = [json.loads(line) for line in f if line.strip()]
+
+        if self.header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {self.header.get('version')}")
+
+        self.seed = self.header['seed']
+        self.size = tuple(self.header['circle_args'][-2:])
+        self.frame_count = sum(1 for record in self.records if 'dt' in record)
+
+    @staticmethod
+    def apply_system(circle_system, changes):
+        """Apply recorded attribute changes to a circle system."""
+        for name, value in changes.items():
+            if name == 'max_groups':
+                circle_system.set_max_groups(value)
+            elif name == 'render_mode':
+                if circle_system.render_mode != value:
+                    circle_system.toggle_render_mode()
+            elif name == 'quality':
+                circle_system.set_quality(**value)
+            else:
+                setattr(circle_system, name, value)
+
+    def create_circle_system(self):
+        """Seed the RNG and create the circle system exactly as recorded."""
+        random.seed(self.seed)
+        circle_system = SpringleCircle(*self.header['circle_args'])
+        self.apply_system(circle_system, self.header['system'])
+        return circle_system
+
+    def replay(self, screen=None, on_frame=None):
+        """
+        Replay every recorded update.
+
+        Args:
+            screen (pygame.Surface): Surface to draw each frame on, or None to
+                only run updates
+            on_frame (callable): Called as on_frame(index, circle_system, params)
+                after each frame
+
+        Returns:
+            tuple: (update_times, draw_times, mismatches) with times in seconds
+            and the number of failed state checksums
+        """
+        circle_system = self.create_circle_system()
+        state = {}
+        update_times = []
+        draw_times = []
+        mismatches = 0
+
+        for record in self.records:
+            if 'check' in record:
+                if state_checksum(circle_system) != record['check']:
+                    mismatches += 1
+                    print(f"Replay diverged from recording before frame {len(update_times)}")
+                continue
+
+            state.update(record.get('params', {}))
+            params = _params_from_dict(state)
+            self.apply_system(circle_system, record.get('system', {}))
+            for action in record.get('actions', []):
+                self.ACTIONS[action](circle_system, params)
+            circle_system.enforce_group_limit(params.max_groups)
+
+            start = time.perf_counter()
+            circle_system.update(record['dt'], params)
+            update_times.append(time.perf_counter() - start)
+
+            if screen is not None:
+                screen.fill((0, 0, 0))
+                start = time.perf_counter()
+                circle_system.draw(screen, params.max_alpha)
+                draw_times.append(time.perf_counter() - start)
+
+            if on_frame is not None:
+                on_frame(len(update_times) - 1, circle_system, params)
+
+        return update_times, draw_times, mismatches
+
+
+def main(argv=None):
+    """Replay a recording headlessly and report the slowest frames."""
+    parser = argparse.ArgumentParser(description='Replay a Springle recording')
+    parser.add_argument('recording', help='File written by springle.py --record')
+    parser.add_argument('--no-draw', action='store_true', help='Only run updates')
+    parser.add_argument('--profile', metavar='PATH', help='Write cProfile stats here')
+    parser.add_argument('--slowest', type=int, default=10, help='Number of slowest frames to list')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+
+    replayer = SceneReplayer(args.recording)
+    screen = None
+    if not args.no_draw:
+        pygame.init()
+        screen = pygame.display.set_mode(replayer.size)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    update_times, draw_times, mismatches = replayer.replay(screen)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        print(f"Profile saved to: {args.profile}")
+
+    totals = [u + (draw_times[i] if draw_times else 0) for i, u in enumerate(update_times)]
+    print(f"Replayed {len(update_times)} frames, {mismatches} checksum mismatches")
+    print(f"Total time: {sum(totals) * 1000:.1f} ms")
+    slowest = sorted(range(len(totals)), key=lambda i: totals[i], reverse=True)[:args.slowest]
+    for i in slowest:
+        draw_ms = draw_times[i] * 1000 if draw_times else 0
+        print(f"  frame {i}: update {update_times[i] * 1000:.2f} ms, draw {draw_ms:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
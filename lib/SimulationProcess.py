@@ -0,0 +1,382 @@
+import contextlib
+import multiprocessing
+import queue
+import random
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from lib.FixedTimestep import FixedTimestep
+from lib.SceneRecorder import SYSTEM_FIELDS, SceneReplayer
+from lib.SimulationThread import Snapshot
+from lib.SpringleCircle import SpringleCircle
+
+# Layout of the shared memory block: a global header holding the newest
+# complete frame and the slot the reader holds, followed by the frame slots.
+# Each slot has its own header and a fixed capacity of drawable elements.
+RING_HEADER = np.dtype([
+    ('latest', 'i8'),       # Newest complete frame number, -1 before the first
+    ('latest_slot', 'i8'),  # Slot holding that frame
+    ('reading', 'i8'),      # Slot leased by the reader, -1 for none
+])
+SLOT_HEADER = np.dtype([
+    ('count', 'i8'),
+    ('simulation_time', 'f8'),
+    ('active_groups', 'i8'),
+])
+ELEMENT = np.dtype([
+    ('x', 'f4'),
+    ('y', 'f4'),
+    ('size', 'f4'),
+    ('rgb', 'u1', 3),
+    ('alpha', 'u1'),
+])
+
+# Attributes forwarded from the display process's circle system; the render
+# mode only matters to the display process
+FORWARDED_FIELDS = tuple(name for name in SYSTEM_FIELDS if name != 'render_mode')
+
+
+class FrameRing:
+    """
+    Ring of simulation frames in a multiprocessing.shared_memory block.
+
+    One process writes frames column by column, another draws the newest one
+    straight from a structured view of its slot, so frames are never pickled
+    or copied. Reading leases the slot: the writer never picks the leased slot
+    or the one holding the newest frame, so a frame stays intact while it is
+    drawn, until the reader takes the next one. Choosing a slot and leasing
+    one happen under a lock shared by both processes; the elements themselves
+    are written and drawn without it.
+    """
+
+    def __init__(self, capacity=65536, slots=4, name=None, lock=None):
+        """
+        Create a ring, or attach to an existing one by name.
+
+        Args:
+            capacity (int): Maximum drawable elements per frame
+            slots (int): Number of frames in the ring, at least 3
+            name (str): Shared memory name of an existing ring
+            lock (multiprocessing.Lock): Lock shared with the other process;
+                a new one is created when None
+        """
+        if slots < 3:
+            raise ValueError("A frame ring needs at least 3 slots")
+        self.capacity = capacity
+        self.slots = slots
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        size = RING_HEADER.itemsize + slots * (SLOT_HEADER.itemsize + capacity * ELEMENT.itemsize)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        buf = self.shm.buf
+        self.header = np.ndarray(1, RING_HEADER, buf, 0)
+        self.slot_headers = []
+        self.slot_elements = []
+        offset = RING_HEADER.itemsize
+        for _ in range(slots):
+            self.slot_headers.append(np.ndarray(1, SLOT_HEADER, buf, offset))
+            offset += SLOT_HEADER.itemsize
+            self.slot_elements.append(np.ndarray(capacity, ELEMENT, buf, offset))
+            offset += capacity * ELEMENT.itemsize
+
+        if name is None:
+            self.header['latest'] = -1
+            self.header['latest_slot'] = -1
+            self.header['reading'] = -1
+        self._next_slot = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def _free_slot(self):
+        """Pick the next slot holding neither the newest frame nor the reader's lease."""
+        busy = (int(self.header['latest_slot'][0]), int(self.header['reading'][0]))
+        for offset in range(self.slots):
+            index = (self._next_slot + offset) % self.slots
+            if index not in busy:
+                self._next_slot = index + 1
+                return index
+
+    def write(self, frame, simulation_time, active_groups, columns):
+        """
+        Store one frame and publish it as the newest.
+
+        Args:
+            frame (int): Increasing frame number
+            simulation_time (float): Simulation time of the frame
+            active_groups (int): Active group count
+            columns (dict): Arrays from SpringleCircle.get_drawable_columns
+
+        Returns:
+            int: Number of elements dropped because the slot was full
+        """
+        with self.lock:
+            index = self._free_slot()
+
+        # Keep the newest elements when over capacity; the oldest are drawn first
+        dropped = max(0, len(columns['x']) - self.capacity)
+        count = len(columns['x']) - dropped
+        view = self.slot_elements[index][:count]
+        for name in ELEMENT.names:
+            view[name] = columns[name][dropped:]
+
+        slot_header = self.slot_headers[index]
+        slot_header['count'] = count
+        slot_header['simulation_time'] = simulation_time
+        slot_header['active_groups'] = active_groups
+        with self.lock:
+            self.header['latest_slot'] = index
+            self.header['latest'] = frame
+        return dropped
+
+    def latest_frame(self):
+        """Get the number of the newest complete frame, -1 before the first."""
+        return int(self.header['latest'][0])
+
+    def read_latest(self):
+        """
+        Lease and read the newest complete frame.
+
+        The columns are a view of the shared memory block. They stay valid
+        until the next read_latest, which moves the lease to a newer slot, and
+        must be released before the ring is closed.
+
+        Returns:
+            Snapshot: Frame whose columns are a structured array for
+            SpringleCircle.draw_columns, or None when nothing was published yet
+        """
+        with self.lock:
+            frame = int(self.header['latest'][0])
+            if frame < 0:
+                return None
+            index = int(self.header['latest_slot'][0])
+            self.header['reading'] = index
+
+        slot_header = self.slot_headers[index]
+        return Snapshot(frame=frame,
+                        simulation_time=float(slot_header['simulation_time'][0]),
+                        active_groups=int(slot_header['active_groups'][0]),
+                        columns=self.slot_elements[index][:int(slot_header['count'][0])])
+
+    def close(self, unlink=False):
+        """Release the views and detach, removing the block when unlink is True."""
+        self.header = None
+        self.slot_headers = []
+        self.slot_elements = []
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _run_simulation(ring_name, ring_lock, capacity, slots, commands, circle_args, system_state,
+                    rate, seed):
+    """
+    Child process entry point: simulate and write frames into the ring.
+
+    Commands arrive on the queue as tuples:
+        ('input', params, system_changes, actions)
+        ('pause', paused)
+        ('stop',)
+    """
+    ring = FrameRing(capacity, slots, name=ring_name, lock=ring_lock)
+    try:
+        if seed is not None:
+            random.seed(seed)
+        circle_system = SpringleCircle(*circle_args)
+        SceneReplayer.apply_system(circle_system, system_state)
+
+        timestep = FixedTimestep(rate)
+        params = None
+        paused = False
+        frame = 0
+        warned = False
+        last = time.perf_counter()
+        timeout = 0.0
+
+        while True:
+            # Wait for input until the next step is due, then drain the rest
+            try:
+                command = commands.get(timeout=timeout)
+                while True:
+                    if command[0] == 'stop':
+                        return
+                    if command[0] == 'pause':
+                        paused = command[1]
+                    elif command[0] == 'input':
+                        _, params, changes, actions = command
+                        SceneReplayer.apply_system(circle_system, changes)
+                        for action in actions:
+                            SceneReplayer.ACTIONS[action](circle_system, params)
+                    command = commands.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            if paused or params is None:
+                timestep.reset()
+                timeout = timestep.step
+                continue
+
+            steps = timestep.advance(elapsed)
+            for _ in range(steps):
+                circle_system.enforce_group_limit(params.max_groups)
+                circle_system.update(timestep.step, params)
+                frame += 1
+
+            if steps:
+                dropped = ring.write(
+                    frame, circle_system.simulation_time,
+                    sum(1 for group in circle_system.groups if group.active),
+                    circle_system.get_drawable_columns(params.max_alpha)
+                )
+                if dropped and not warned:
+                    print(f"Frame ring full, dropping the {dropped} oldest elements")
+                    warned = True
+
+            timeout = max(0.0, timestep.step - timestep.accumulator)
+    except Exception:
+        print("Simulation process stopped by an error:")
+        traceback.print_exc()
+    finally:
+        ring.close()
+
+
+class SimulationProcess:
+    """
+    Runs SpringleCircle physics and trail bookkeeping in a child process.
+
+    The child writes each frame's drawable columns into a shared memory
+    FrameRing, and this process draws them from the ring in place. Input
+    flows the other way over a queue: SpringleParams every frame, plus any
+    attributes of the local circle system that changed (see
+    SceneRecorder.SYSTEM_FIELDS) and group actions, applied in the child
+    exactly as a SceneReplayer would.
+
+    The local circle system is only used as the source of those settings,
+    including its quality, and for drawing the frames; it is never updated.
+
+    Offers the same set_params / latest / paused / lock interface as
+    SimulationThread.
+    """
+
+    def __init__(self, circle_system, circle_args, rate=60, seed=None, capacity=65536, slots=4):
+        """
+        Initialize the process without starting it.
+
+        Args:
+            circle_system (SpringleCircle): Local system holding the settings
+            circle_args (tuple): Positional arguments to create the child's system
+            rate (float): Simulation steps per second
+            seed (int): RNG seed for the child, random when None
+            capacity (int): Maximum drawable elements per frame
+            slots (int): Frames in the shared memory ring, at least 3
+        """
+        self.circle_system = circle_system
+        self.circle_args = tuple(circle_args)
+        self.rate = rate
+        self.seed = seed
+        self.capacity = capacity
+        self.slots = slots
+
+        # The local circle system is never updated, so there is nothing to guard
+        self.lock = contextlib.nullcontext()
+
+        self._context = multiprocessing.get_context('spawn')  # SDL state must not be forked
+        self._commands = None
+        self._process = None
+        self._ring = None
+        self._paused = False
+        self._actions = []
+        self._last_system = None
+        self._snapshot = None
+
+    @property
+    def paused(self):
+        return self._paused
+
+    @paused.setter
+    def paused(self, value):
+        self._paused = bool(value)
+        if self._commands is not None:
+            self._commands.put(('pause', self._paused))
+
+    def _system_state(self):
+        return {name: getattr(self.circle_system, name) for name in FORWARDED_FIELDS}
+
+    def start(self):
+        """Create the shared memory ring and start the child process."""
+        if self._process is not None:
+            return
+        self._ring = FrameRing(self.capacity, self.slots, lock=self._context.Lock())
+        self._commands = self._context.Queue()
+        self._last_system = self._system_state()
+        self._process = self._context.Process(
+            target=_run_simulation, name='SimulationProcess', daemon=True,
+            args=(self._ring.name, self._ring.lock, self.capacity, self.slots, self._commands,
+                  self.circle_args, self._last_system, self.rate, self.seed)
+        )
+        self._process.start()
+        if self._paused:
+            self._commands.put(('pause', True))
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the child process and remove the shared memory ring.
+
+        Snapshots returned by latest() point into the ring and must not be
+        used afterwards.
+        """
+        if self._process is None:
+            return
+        self._commands.put(('stop',))
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+        self._commands.close()
+        self._commands = None
+        self._snapshot = None
+        self._ring.close(unlink=True)
+        self._ring = None
+
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def send_action(self, name):
+        """
+        Queue a group action for the child.
+
+        Args:
+            name (str): One of SceneReplayer.ACTIONS
+        """
+        self._actions.append(name)
+
+    def set_params(self, params):
+        """Send the latest parameters, changed settings and queued actions to the child."""
+        if self._commands is None:
+            return
+        system = self._system_state()
+        changes = {k: v for k, v in system.items() if self._last_system[k] != v}
+        self._last_system = system
+        self._commands.put(('input', params, changes, self._actions))
+        self._actions = []
+
+    def latest(self):
+        """Get the newest frame written by the child, or None before the first one."""
+        if self._ring is None:
+            return None
+        if self._snapshot is not None and self._snapshot.frame == self._ring.latest_frame():
+            return self._snapshot
+        snapshot = self._ring.read_latest()
+        if snapshot is not None:
+            self._snapshot = snapshot
+        return self._snapshot
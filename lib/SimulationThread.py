@@ -0,0 +1,116 @@
+import threading
+import time
+import traceback
+from collections import namedtuple
+
+from lib.FixedTimestep import FixedTimestep
+
+# One published simulation state. Never modified after publishing, so the
+# render thread can draw it without holding any lock.
+Snapshot = namedtuple('Snapshot', 'frame simulation_time active_groups columns')
+
+
+class SimulationThread:
+    """
+    Runs SpringleCircle updates on a background thread.
+
+    The worker advances the simulation on a fixed timestep and after each batch
+    of steps publishes a Snapshot of the drawable columns into a double buffer:
+    it fills the back slot and then flips which slot is the front. The render
+    thread only ever reads the front slot, so a slow draw no longer delays the
+    simulation and vice versa.
+
+    Anything else that touches the circle system, e.g. UI handlers changing
+    settings or adding groups, must hold self.lock.
+    """
+
+    def __init__(self, circle_system, step=None, rate=60):
+        """
+        Initialize the thread without starting it.
+
+        Args:
+            circle_system (SpringleCircle): System to simulate
+            step (callable): Called as step(dt, params) for every fixed step;
+                defaults to circle_system.update
+            rate (float): Simulation steps per second
+        """
+        self.circle_system = circle_system
+        self.step = step or circle_system.update
+        self.timestep = FixedTimestep(rate)
+        self.lock = threading.Lock()
+        self.paused = False
+
+        self._params = None
+        self._buffers = [None, None]
+        self._front = 0
+        self._frame = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def set_params(self, params):
+        """Hand the worker the parameters to use from its next step on."""
+        self._params = params
+
+    def latest(self):
+        """Get the most recently published Snapshot, or None before the first one."""
+        return self._buffers[self._front]
+
+    def start(self):
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='SimulationThread', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop the worker thread and wait for it to finish."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _publish(self, params):
+        """Fill the back buffer from the current state and make it the front."""
+        system = self.circle_system
+        back = 1 - self._front
+        self._buffers[back] = Snapshot(
+            frame=self._frame,
+            simulation_time=system.simulation_time,
+            active_groups=sum(1 for group in system.groups if group.active),
+            # Fresh arrays, not views of the trail ring the worker keeps changing
+            columns=system.get_drawable_columns(params.max_alpha)
+        )
+        self._front = back
+
+    def _run(self):
+        """Worker loop: step, publish, then sleep until the next step is due."""
+        last = time.perf_counter()
+        try:
+            while not self._stop_event.is_set():
+                now = time.perf_counter()
+                elapsed, last = now - last, now
+                params = self._params
+
+                if self.paused or params is None:
+                    self.timestep.reset()
+                    self._stop_event.wait(self.timestep.step)
+                    continue
+
+                steps = self.timestep.advance(elapsed)
+                if steps:
+                    with self.lock:
+                        for _ in range(steps):
+                            self.step(self.timestep.step, params)
+                            self._frame += 1
+                        self._publish(params)
+
+                # Sleep for the rest of the step
+                self._stop_event.wait(max(0.0, self.timestep.step - self.timestep.accumulator))
+        except Exception:
+            print("Simulation thread stopped by an error:")
+            traceback.print_exc()
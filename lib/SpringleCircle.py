@@ -1,46 +1,57 @@
 import pygame
+import heapq
+import itertools
 import math
-from functools import lru_cache
+import numpy as np
 
 # Local imports
 from lib.OrbitGroup import OrbitGroup
+from lib.ParticleEngine import ParticleEngine, EngineMotion
+from lib.TrailRing import TrailRing
+from lib.TrailAccumulator import TrailAccumulator
+from lib.TrailFade import fade_alphas
+from lib.TrailEmission import emit_trail_points
 from lib.SpingleColors import SpingleColors
 from lib.MouseControlSystem import MouseControlSystem
 from lib.SpringleParams import SpringleParams
+from lib.SpriteCache import SpriteCache
 
 
-class GradientCache:
-    """Optimized cache system for gradient surfaces"""
-    def __init__(self, size_step=2, alpha_step=16):
+def blit_sequence(screen, sequence):
+    """
+    Blit (surface, position) pairs in a single call.
+    
+    Uses pygame-ce's Surface.fblits when available, which skips building the
+    list of dirty rects that Surface.blits returns.
+    
+    Args:
+        screen (pygame.Surface): Target surface
+        sequence (list): (surface, position) pairs in draw order
+    """
+    if hasattr(screen, 'fblits'):
+        screen.fblits(sequence)
+    else:
+        screen.blits(sequence, doreturn=False)
+
+
+class GradientCache(SpriteCache):
+    """Byte-budgeted LRU cache for gradient surfaces"""
+    def __init__(self, size_step=2, alpha_step=16, max_bytes=64 * 1024 * 1024):
+        super().__init__(max_bytes, sizeof=self.surface_bytes)
         self.size_step = size_step
         self.alpha_step = alpha_step
-        self._cache = {}
         
     @staticmethod
-    @lru_cache(maxsize=1024)
-    def _make_cache_key(size: int, r: int, g: int, b: int, alpha: int) -> tuple:
-        """Create a cache key using the lru_cache decorator for memoization"""
-        return (size, r, g, b, alpha)
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Get the pixel memory of a surface"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
     
-    def get_key(self, size: float, color: tuple, alpha: int) -> tuple:
+    def get_key(self, size: float, alpha: int) -> tuple:
         """Get cache key with minimal computation and object creation"""
         # Round size and alpha to reduce cache variations
         size_rounded = round(size / self.size_step) * self.size_step
-        alpha_rounded = round(alpha / self.alpha_step) * self.alpha_step
-        
-        # Unpack color tuple directly into key creation
-        return self._make_cache_key(size_rounded, color[0], color[1], color[2], alpha_rounded)
-    
-    def get(self, key: tuple) -> pygame.Surface:
-        """Get item from cache"""
-        return self._cache.get(key)
-    
-    def set(self, key: tuple, surface: pygame.Surface) -> None:
-        """Set item in cache"""
-        self._cache[key] = surface
-    
-    def __len__(self) -> int:
-        return len(self._cache)
+        alpha_rounded = min(255, round(alpha / self.alpha_step) * self.alpha_step)
+        return (size_rounded, alpha_rounded)
     
 class SpringleCircle:
     def __init__(self, min_circles, max_circles, 
@@ -54,9 +65,13 @@ class SpringleCircle:
         # Initialize with default parameters
         self.params = SpringleParams.from_defaults()
         
+        # Shared motion state for every circle, stepped once per frame
+        self.engine = ParticleEngine()
+        
         self.groups = [OrbitGroup(min_circles, max_circles, 0, base_size,
                                   radial_velocity, angular_velocity,
-                                  radial_acceleration, angular_acceleration, False)]
+                                  radial_acceleration, angular_acceleration, False,
+                                  engine=self.engine)]
         # Store creation time with the initial group
         self.groups[0].creation_time = 0.0
         self.max_groups = 7  # Change from constant to instance variable
@@ -66,22 +81,52 @@ class SpringleCircle:
         self.center = (WIDTH // 2, HEIGHT // 2)
         self.screen_diagonal = math.sqrt(WIDTH**2 + HEIGHT**2)
         
+        # Min-heap of (expiry_time, sequence, group). Entries go stale when a
+        # group is rescheduled or removed and are skipped when popped.
+        self._expiry_heap = []
+        self._expiry_sequence = itertools.count()
+        self._last_dt = 1 / 60
+        self._schedule_expiry(self.groups[0])
+        
         self.color_transition_speed = 0.2
         self.spawn_cooldown_start = 4.0  # Starting value for cooldown timer
         self.spawn_cooldown_current = self.spawn_cooldown_start  # Initialize with full cooldown to prevent immediate spawn
         self.fade_duration = 10.0  # Time in seconds for trails to fully fade
+        self.space_factor = 0.5  # Trail point spacing in units of circle size
 
-        self.colors = SpingleColors()  # Create instance of SpingleColors
+        self.colors = SpingleColors.shared()  # Process-wide palette registry
         self.mouse_control = MouseControlSystem()
         self.mouse_control.set_screen_center(self.center)
         
-        # New: Separate list for fading trails
-        self.fading_trails = []
+        # Columnar storage for every trail point, including those of removed groups
+        self.trails = TrailRing()
+        
+        # 'redraw' blits every live trail point each frame; 'accumulate' stamps
+        # only new points onto persistent fading layers
+        self.render_mode = 'redraw'
+        self.accumulator = None
+        self._stamped_total = 0  # TrailRing.total_appended at the last stamp
+        
+        # Fraction of a step between the previous and the latest update at which
+        # current circles are drawn; 1 draws the latest state as is
+        self.render_alpha = 1.0
 
-        # Initialize gradient cache
+        # Initialize gradient cache with white sprites keyed on (size, alpha),
+        # plus a small cache of their tinted copies
         self.gradient_cache = GradientCache(size_step=2, alpha_step=16)
+        self.tint_cache = SpriteCache(max_bytes=16 * 1024 * 1024, sizeof=GradientCache.surface_bytes)
         self.max_cached_size = 100
         
+        # Quality settings, lowered by QualityGovernor when frames run long
+        self.gradient_steps = 15       # Rings drawn per gradient sprite
+        self.thin_after = None         # Fraction of fade_duration after which every 2nd trail point is skipped
+        self.max_trail_points = None   # Oldest trail points beyond this are dropped
+        
+        # Trail level of detail: (fraction of fade_duration, stride) pairs. Past
+        # each age only every stride-th point of a circle's trail is kept. Earlier
+        # thresholds thin dense trails visibly, see test/test_trail_lod.py.
+        self.trail_lod = ((0.7, 2), (0.9, 4))
+        
         # Initialize gradient cache
         # self.gradient_cache = {}
         # self.max_cached_size = 100  # Maximum circle size to cache
@@ -94,26 +139,35 @@ class SpringleCircle:
         
         
     def _get_cached_gradient(self, size, color, alpha):
-        """Get or create a cached gradient surface with optimized caching."""
+        """Get a gradient surface tinted to color, reusing cached sprites."""
         # Get cache key with minimal overhead
-        cache_key = self.gradient_cache.get_key(size, color, alpha)
+        cache_key = self.gradient_cache.get_key(size, alpha)
+        tint_key = cache_key + tuple(color)
         
-        # Fast cache lookup
-        surface = self.gradient_cache.get(cache_key)
+        # Fast lookup of recently used colors
+        surface = self.tint_cache.get(tint_key)
         if surface is not None:
             return surface
+        
+        # White sprites only depend on size and alpha
+        sprite = self.gradient_cache.get(cache_key)
+        if sprite is None:
+            sprite = self._create_gradient_circle(*cache_key)
             
-        # Create new gradient surface if not in cache
-        surface = self._create_gradient_circle(size, color, alpha)
+            # Only cache if size is within reasonable limits
+            if size <= self.max_cached_size:
+                self.gradient_cache.set(cache_key, sprite)
         
-        # Only cache if size is within reasonable limits
+        # Multiplying white by the color leaves exactly the color
+        surface = sprite.copy()
+        surface.fill((color[0], color[1], color[2], 255), special_flags=pygame.BLEND_RGBA_MULT)
         if size <= self.max_cached_size:
-            self.gradient_cache.set(cache_key, surface)
+            self.tint_cache.set(tint_key, surface)
             
         return surface
 
-    def _create_gradient_circle(self, size, color, alpha):
-        """Create a circle with a radial gradient effect - optimized version."""
+    def _create_gradient_circle(self, size, alpha):
+        """Create a white circle with a radial gradient effect, tinted when drawn."""
         # Round size to int once at the start
         int_size = int(size)
         surface_size = int_size * 2
@@ -123,20 +177,15 @@ class SpringleCircle:
         center = (int_size, int_size)
         
         # Pre-calculate gradient steps
-        num_steps = 15
-        r, g, b = color
+        num_steps = self.gradient_steps
         
         # Pre-calculate all colors and radii
         steps = []
         for i in range(num_steps):
             factor = i / num_steps
             radius = int_size * (1 - factor)
-            gradient_color = (
-                int(r * (1 - factor * 0.5)),
-                int(g * (1 - factor * 0.5)),
-                int(b * (1 - factor * 0.5)),
-                int(alpha * (1 - factor * 0.3))
-            )
+            shade = int(255 * (1 - factor * 0.5))
+            gradient_color = (shade, shade, shade, int(alpha * (1 - factor * 0.3)))
             steps.append((radius, gradient_color))
         
         # Draw circles in a single pass
@@ -224,25 +273,115 @@ class SpringleCircle:
 
     #     return surface
     
-    def should_add_trail_point(self, new_pos, last_pos, circle_size, space_factor, dt=0):
-        """Determine if a new trail point should be added based on distance."""
-        if last_pos is None:
-            return True
-        dx = new_pos[0] - last_pos[0]
-        dy = new_pos[1] - last_pos[1]
-        distance = math.sqrt(dx * dx + dy * dy)
-        return (distance >= circle_size * space_factor)
-
+    def _schedule_expiry(self, group):
+        """
+        Predict when a group leaves the screen and queue its expiry check.
+        
+        The prediction holds until the group's radial acceleration changes or
+        it is thrown, and update schedules it again in both cases.
+        """
+        lifetime = group.predict_lifetime((self.WIDTH, self.HEIGHT), self._last_dt)
+        group.expiry_time = self.simulation_time + lifetime
+        if lifetime == math.inf:
+            return  # Never leaves at this acceleration
+        heapq.heappush(self._expiry_heap, (group.expiry_time, next(self._expiry_sequence), group))
+        
+        # Drop stale entries once they outnumber the live ones
+        if len(self._expiry_heap) > 2 * len(self.groups) + 8:
+            self._expiry_heap = [
+                (g.expiry_time, next(self._expiry_sequence), g)
+                for g in self.groups
+                if g.expiry_time is not None and g.expiry_time != math.inf
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _expire_groups(self):
+        """
+        Deactivate groups whose predicted expiry has passed and that really
+        are off screen.
+        
+        Returns:
+            bool: Whether any group was deactivated
+        """
+        expired = False
+        rescheduled = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= self.simulation_time:
+            expiry_time, _, group = heapq.heappop(heap)
+            if group.expiry_time != expiry_time:
+                continue  # Stale entry
+            if group.is_circle_visible((self.WIDTH, self.HEIGHT)):
+                rescheduled.append(group)  # Prediction was early; push after the loop
+            else:
+                group.active = False
+                group.expiry_time = None
+                expired = True
+        for group in rescheduled:
+            self._schedule_expiry(group)
+        return expired
+    
+    def _remove_groups(self, removed):
+        """
+        Remove groups in a single pass over the group list.
+        
+        Their expiry heap entries go stale and are skipped when popped.
+        
+        Args:
+            removed (list): Groups to remove
+        """
+        if not removed:
+            return
+        for group in removed:
+            group.expiry_time = None
+        removed = set(map(id, removed))
+        self.groups = [group for group in self.groups if id(group) not in removed]
+    
     def set_max_groups(self, value):
         """Set the maximum number of allowed groups."""
         self.max_groups = value
-        # Remove excess groups if current count exceeds new maximum
-        active_groups = [g for g in self.groups if g.active]
-        while len(active_groups) > self.max_groups:
-            oldest_group = min(active_groups, key=lambda g: g.creation_time)
-            self.groups.remove(oldest_group)
-            active_groups.remove(oldest_group)
+        # Remove excess groups if current count exceeds new maximum; groups
+        # are kept in creation order so the oldest active ones come first
+        excess = sum(1 for g in self.groups if g.active) - self.max_groups
+        if excess > 0:
+            self._remove_groups([g for g in self.groups if g.active][:excess])
             
+    def enforce_group_limit(self, max_groups):
+        """Remove the oldest non-mouse groups while there are more than max_groups."""
+        excess = len(self.groups) - max_groups
+        if excess > 0:
+            self._remove_groups([g for g in self.groups if not g.is_mouse_group][:excess])
+
+    def create_group(self, params):
+        """
+        Add a new automatic group built from the current parameters.
+
+        Args:
+            params (SpringleParams): Current settings
+
+        Returns:
+            OrbitGroup: The new group
+        """
+        new_group = OrbitGroup(
+            params.min_circles, params.max_circles, 0, params.base_size, 
+            params.radial_velocity, params.angular_velocity,
+            params.radial_acceleration, params.angular_acceleration, False,
+            engine=self.engine
+        )
+        new_group.creation_time = self.simulation_time
+        self.groups.append(new_group)
+        self._schedule_expiry(new_group)
+        return new_group
+
+    def clear_groups(self, params):
+        """Replace all groups and trails with a single new group."""
+        for group in self.groups:
+            group.expiry_time = None
+        self.groups = []
+        self._expiry_heap = []
+        self.clear_trails()
+        self.spawn_cooldown_current = self.spawn_cooldown_start
+        self.create_group(params)
+
     def calculate_circle_size(self, radius, base_size, size_variation):
         """Calculate circle size based on radius from center."""
         size_factor = math.log(radius + 1) / 5 if radius > 0 else 1
@@ -252,8 +391,10 @@ class SpringleCircle:
         """Update all groups and handle mouse interaction."""
         # Update simulation time
         self.simulation_time += dt
+        self._last_dt = dt
         
         self.fade_duration = params.fade_duration
+        self.space_factor = params.space_factor
         need_new_group = False
         
         # Handle mouse input
@@ -262,7 +403,7 @@ class SpringleCircle:
                 self.mouse_control.start_drag(params.mouse_pos)
                 new_group = OrbitGroup(
                     params.min_circles, params.max_circles, 0, params.base_size, 
-                    0, 0, 0, 0, True
+                    0, 0, 0, 0, True, engine=self.engine
                 )
                 new_group.creation_time = self.simulation_time  # Store creation time
                 new_group.set_group_position(params.mouse_pos, self.center)
@@ -278,50 +419,45 @@ class SpringleCircle:
             if self.groups:
                 latest_group = self.groups[-1]
                 latest_group.handle_mouse_release(params.mouse_pos, velocity, self.center)
+                self._schedule_expiry(latest_group)
         
         active_groups = 0
         for group in self.groups:
-            was_active = group.active
-            
             # Update parameters from current settings
             if group.active:
                 active_groups += 1
                 group.update_circle_acceleration(params.radial_acceleration, params.angular_acceleration)
                 group.update_circle_size(params.base_size)
                 
+                # A new acceleration invalidates the predicted expiry
+                if (group.expiry_time is not None and
+                        group.circles[0]['motion'].radial_acceleration != group.predicted_acceleration):
+                    self._schedule_expiry(group)
+                
                 # Update color transition
                 group.color_transition += dt * self.color_transition_speed
                 if group.color_transition >= 1:
                     group.color_transition = 0
                     group.palette_index = (group.palette_index + 1) % self.colors.numPatterns()
                 
-                # Update circle positions
+                # Update circle positions (engine-backed circles only bump time offsets)
                 group.update_circle_positions(dt)
-                
-                # Check if group is still visible
-                group.active = group.is_circle_visible((self.WIDTH, self.HEIGHT))
-                
-                # Update trails for active groups
-                self._update_group_trails(group, dt, params.space_factor)
+        
+        # Advance every engine-backed circle in one vectorized step
+        self.engine.step(dt)
+        
+        # Deactivate groups whose predicted exit time has come
+        expired = self._expire_groups()
+        
+        # Emit trail points for every active circle at once
+        self._emit_trail_points(params.space_factor)
             
-            # If group just became inactive, move its trails to fading_trails
-            if was_active and not group.active:
-                for circle in group.circles:
-                    if circle['trail']:
-                        # The trail points now have 6 values (x, y, color, size, age, creation_time)
-                        self.fading_trails.extend([
-                            (group.creation_time, (x, y, color, size, age))  # Extract first 5 values, store with group time
-                            for x, y, color, size, age, _ in circle['trail']  # Unpack all 6 values
-                        ])
-                        circle['trail'] = []
-        
-        # Update fading trails
-        updated_fading_trails = []
-        for creation_time, (x, y, color, size, age) in self.fading_trails:
-            new_age = age + dt
-            if new_age < self.fade_duration:
-                updated_fading_trails.append((creation_time, (x, y, color, size, new_age)))
-        self.fading_trails = updated_fading_trails
+        # Drop expired trail points; points of removed groups fade out in place
+        self.trails.expire(self.simulation_time, self.fade_duration)
+        if self.trail_lod:
+            self.trails.decimate(self.simulation_time, self.fade_duration, self.trail_lod)
+        if self.max_trail_points is not None:
+            self.trails.trim(self.max_trail_points)
         
         # Rest of update logic (spawn cooldown, new groups, etc.)
         if self.spawn_cooldown_current >= 0:
@@ -333,101 +469,243 @@ class SpringleCircle:
                 
         # Update max_groups when checking for new group creation
         if need_new_group and active_groups < self.max_groups:  # Use instance variable instead of constant
-            new_group = OrbitGroup(
-                params.min_circles, params.max_circles, 0, params.base_size, 
-                params.radial_velocity, params.angular_velocity,
-                params.radial_acceleration, params.angular_acceleration, False
-            )
-            new_group.creation_time = self.simulation_time
-            self.groups.append(new_group)
+            self.create_group(params)
             self.spawn_cooldown_current = self.spawn_cooldown_start
             
         # Only remove completely inactive groups (no trails)
-        self.groups = [group for group in self.groups if group.active]
+        if expired:
+            self.groups = [group for group in self.groups if group.active]
+        
+    def _emit_trail_points(self, space_factor):
+        """
+        Add trail points for all active circles in one vectorized pass.
+        
+        Each circle emits a point whenever it moved size * space_factor from
+        its last point; longer moves are filled in with evenly spaced points.
+        """
+        slots = []
+        size_scales = []
+        owners = []
+        for group in self.groups:
+            if group.active:
+                for circle in group.circles:
+                    slots.append(circle['motion'].slot)
+                    size_scales.append(circle['base_size'] * circle['size_variation'])
+                    owners.append((group, circle))
+        if not slots:
+            return
+        
+        slots = np.array(slots, dtype=np.intp)
+        engine = self.engine
+        xs, ys = engine.to_cartesian(slots, self.center[0], self.center[1])
+        
+        # Vectorized calculate_circle_size
+        radius = engine.radius[slots]
+        sizes = np.array(size_scales) * np.where(radius > 0, np.log1p(np.maximum(radius, 0)) / 5, 1.0)
+        
+        last_xs = engine.trail_x[slots]
+        last_ys = engine.trail_y[slots]
+        index, px, py = emit_trail_points(xs, ys, last_xs, last_ys, sizes * space_factor)
+        engine.trail_x[slots] = last_xs
+        engine.trail_y[slots] = last_ys
+        if len(index) == 0:
+            return
+        
+        # Number each circle's points so they can be decimated evenly later
+        counts = np.bincount(index, minlength=len(slots))
+        starts = np.cumsum(counts) - counts
+        emit_index = engine.trail_count[slots][index] + np.arange(len(index)) - starts[index]
+        engine.trail_count[slots] += counts
+        
+        # Trail points never move, so points emitted off screen would never be
+        # drawn; fast circles spend most of their gap-filled points out there
+        on_screen = self.on_screen_mask(px, py, sizes[index])
+        if not on_screen.all():
+            index, px, py, emit_index = (index[on_screen], px[on_screen], py[on_screen],
+                                         emit_index[on_screen])
+            if len(index) == 0:
+                return
         
-    def _update_group_trails(self, group, dt, space_factor):
-        """Update trails for a single group."""
-        for circle in group.circles:
-            # Get current position
+        # Colors and group times are only looked up for circles that emit
+        emitting = np.unique(index)
+        rgb = np.zeros((len(slots), 3), dtype=np.uint8)
+        group_times = np.zeros(len(slots))
+        for i in emitting.tolist():
+            group, circle = owners[i]
+            rgb[i] = self.colors.getColor(group.palette_index, circle['color_index'], group.color_transition)
+            group_times[i] = group.creation_time
+        
+        # Ages are derived from the creation time when drawing
+        self.trails.extend(px, py, rgb[index], sizes[index], self.simulation_time,
+                           group_times[index], emit_index)
+
+    def clear_trails(self):
+        """Remove all trail points."""
+        self.trails.clear()
+        if self.accumulator is not None:
+            self.accumulator.clear()
+        self.engine.trail_x[:] = np.nan
+        self.engine.trail_y[:] = np.nan
+
+    def set_quality(self, size_step=2, alpha_step=16, gradient_steps=15,
+                    thin_after=None, max_trail_points=None):
+        """
+        Change the rendering quality settings.
+        
+        Args:
+            size_step (int): Size quantization of the gradient cache
+            alpha_step (int): Alpha quantization of the gradient cache
+            gradient_steps (int): Rings drawn per gradient sprite
+            thin_after (float): Fraction of fade_duration after which only every
+                2nd trail point is drawn, None to draw all
+            max_trail_points (int): Cap on live trail points, None for no cap
+        """
+        cache = self.gradient_cache
+        if (size_step, alpha_step, gradient_steps) != (cache.size_step, cache.alpha_step, self.gradient_steps):
+            # Cached sprites were built for the old settings
+            cache.size_step = size_step
+            cache.alpha_step = alpha_step
+            self.gradient_steps = gradient_steps
+            cache.clear()
+            self.tint_cache.clear()
+        self.thin_after = thin_after
+        self.max_trail_points = max_trail_points
+
+    @property
+    def quality(self):
+        """The current rendering quality as set_quality keyword arguments."""
+        return {
+            'size_step': self.gradient_cache.size_step,
+            'alpha_step': self.gradient_cache.alpha_step,
+            'gradient_steps': self.gradient_steps,
+            'thin_after': self.thin_after,
+            'max_trail_points': self.max_trail_points,
+        }
+
+    def toggle_render_mode(self):
+        """Switch between full redraw and the accumulation layers."""
+        self.render_mode = 'accumulate' if self.render_mode == 'redraw' else 'redraw'
+        self.accumulator = None  # Rebuilt from the live trail points on next draw
+
+    def _draw_accumulated(self, screen, max_alpha):
+        """Stamp new trail points onto the accumulation layers and composite them."""
+        if self.accumulator is None or self.accumulator.size != screen.get_size():
+            self.accumulator = TrailAccumulator(screen.get_size())
+            self.accumulator.reset(self.simulation_time, self.fade_duration)
+            # Back-fill every live point into its layer
+            self._stamped_total = self.trails.total_appended - len(self.trails)
+        else:
+            self.accumulator.advance(self.simulation_time, self.fade_duration)
+        
+        # Only points added since the previous frame are drawn, and only if on screen
+        columns = self.trails.newest(self.trails.total_appended - self._stamped_total)
+        self._stamped_total = self.trails.total_appended
+        visible = self.on_screen_mask(columns['x'], columns['y'], columns['size'])
+        for x, y, color, size, creation_time in zip(
+                columns['x'][visible].tolist(), columns['y'][visible].tolist(),
+                columns['rgb'][visible].tolist(), columns['size'][visible].tolist(),
+                columns['creation_time'][visible].tolist()):
+            gradient_surface = self._get_cached_gradient(size, tuple(color), max_alpha)
+            self.accumulator.stamp(gradient_surface, (x - size, y - size), creation_time)
+        
+        # Points are space_factor * size apart and cover 2 * size, so a pixel
+        # on a trail lies under pi / (2 * space_factor) points on average.
+        # Sprite alpha falls to 70% at the rim, 90% of max_alpha on average.
+        overlap = math.pi / (2 * self.space_factor) if self.space_factor > 0 else 1.0
+        self.accumulator.composite(screen, self.simulation_time, self.fade_duration,
+                                   0.9 * max_alpha, overlap)
+        
+        # Current circles are drawn fresh on top every frame
+        heads = []
+        for group in sorted(self.groups, key=lambda g: g.creation_time):
+            if not group.active:
+                continue
+            for circle in group.circles:
+                x, y, radius = self._head_position(group, circle)
+                if (0 <= x <= self.WIDTH * 1.2 and 0 <= y <= self.HEIGHT * 1.2):
+                    color = self.colors.getColor(
+                        group.palette_index, 
+                        circle['color_index'], 
+                        group.color_transition
+                    )
+                    size = self.calculate_circle_size(
+                        radius,
+                        circle['base_size'],
+                        circle['size_variation']
+                    )
+                    heads.append((self._get_cached_gradient(size, color, 255), (x - size, y - size)))
+        blit_sequence(screen, heads)
+
+    def _head_position(self, group, circle):
+        """
+        Get where a current circle is drawn, interpolated by render_alpha.
+        
+        Returns:
+            tuple: (x, y, radius)
+        """
+        motion = circle['motion']
+        if self.render_alpha >= 1 or not isinstance(motion, EngineMotion):
             x, y = group.get_circle_cartesian_pos(circle, self.center)
+            return x, y, motion.radius
+        
+        radius, theta = self.engine.interpolate(motion.slot, self.render_alpha)
+        return (self.center[0] + radius * math.cos(theta),
+                self.center[1] + radius * math.sin(theta),
+                radius)
+    
+    def on_screen_mask(self, xs, ys, sizes):
+        """
+        Find the trail points whose sprite overlaps the window.
+        
+        Args:
+            xs (np.ndarray): Sprite center x coordinates
+            ys (np.ndarray): Sprite center y coordinates
+            sizes (np.ndarray): Sprite radii
             
-            # Calculate circle properties
-            current_size = self.calculate_circle_size(
-                circle['motion'].radius,
-                circle['base_size'],
-                circle['size_variation']
-            )
-            
-            # Calculate color
-            color = self.colors.getColor(group.palette_index, circle['color_index'], group.color_transition)
-            
-            # Add trail point if needed
-            if self.should_add_trail_point((x, y), circle['last_trail_pos'], 
-                                       current_size, space_factor):
-                # Include creation time with trail point
-                circle['trail'].append((x, y, color, current_size, 0.0, self.simulation_time))
-                circle['last_trail_pos'] = (x, y)
-            
-            # Update trail ages and remove old points
-            updated_trail = []
-            for point in circle['trail']:
-                px, py, pcolor, psize, age, creation_time = point
-                new_age = age + dt
-                if new_age < self.fade_duration:
-                    updated_trail.append((px, py, pcolor, psize, new_age, creation_time))
-            circle['trail'] = updated_trail
-
-    def draw(self, screen, max_alpha):
-        """Draw all groups and their trails with proper creation time ordering."""
-        # Dictionary to collect all drawable elements, keyed by creation time
-        group_elements = {}
-        
-        # Add fading trails
-        for creation_time, (x, y, color, size, age) in self.fading_trails:
-            fade_progress = age / self.fade_duration
-            eased_fade = 1 - (fade_progress * fade_progress * fade_progress)
-            alpha = int(max(0, max_alpha * eased_fade))
+        Returns:
+            np.ndarray: Boolean mask, True where any part of the sprite is visible
+        """
+        # Cached sprites are rounded up to the next size step at most
+        reach = sizes + self.gradient_cache.size_step
+        return ((xs + reach >= 0) & (xs - reach <= self.WIDTH) &
+                (ys + reach >= 0) & (ys - reach <= self.HEIGHT))
+    
+    def get_drawable_columns(self, max_alpha):
+        """
+        Get everything the redraw mode blits this frame, in draw order.
+        
+        The columns are new arrays rather than views of the trail ring, so they
+        can be drawn later by another thread or copied into shared memory while
+        the simulation carries on.
+        
+        Args:
+            max_alpha (int): Alpha of the newest trail points
             
-            if alpha > 0:
-                if creation_time not in group_elements:
-                    group_elements[creation_time] = []
-                group_elements[creation_time].append({
-                    'type': 'trail',
-                    'x': x,
-                    'y': y,
-                    'color': color,
-                    'size': size,
-                    'alpha': alpha
-                })
-        
-        # Add active groups' elements
+        Returns:
+            dict: 'x', 'y', 'size', 'alpha' and (n, 3) 'rgb' arrays, grouped by the
+            creation time of their group with each group's trails before its
+            current circles
+        """
+        # Fade every trail point at once; sprites only depend on the alpha bucket
+        columns = self.trails.columns()
+        ages = self.trails.ages(self.simulation_time)
+        _, visible, buckets = fade_alphas(ages, self.fade_duration,
+                                          max_alpha, alpha_step=self.gradient_cache.alpha_step)
+        visible &= self.on_screen_mask(columns['x'], columns['y'], columns['size'])
+        
+        # Skip every other faded point of each circle, stable between frames
+        if self.thin_after is not None:
+            visible &= (ages < self.thin_after * self.fade_duration) | \
+                       (columns['emit_index'] % 2 == 0)
+        
+        # Current circles of active groups, drawn after their group's trails
+        heads = []
         for group in self.groups:
             if not group.active:
                 continue
-                
-            if group.creation_time not in group_elements:
-                group_elements[group.creation_time] = []
             
-            # Add trails for active circles
-            for circle_idx, circle in enumerate(group.circles):
-                # Add trails
-                for x, y, color, size, age, _ in circle['trail']:
-                    fade_progress = age / self.fade_duration
-                    eased_fade = 1 - (fade_progress * fade_progress * fade_progress)
-                    alpha = int(max(0, max_alpha * eased_fade))
-                    
-                    if alpha > 0:
-                        group_elements[group.creation_time].append({
-                            'type': 'trail',
-                            'x': x,
-                            'y': y,
-                            'color': color,
-                            'size': size,
-                            'alpha': alpha
-                        })
-                
-                # Add current circles
-                x, y = group.get_circle_cartesian_pos(circle, self.center)
+            for circle in group.circles:
+                x, y, radius = self._head_position(group, circle)
                 if (0 <= x <= self.WIDTH * 1.2 and 0 <= y <= self.HEIGHT * 1.2):
                     color = self.colors.getColor(
                         group.palette_index, 
@@ -435,29 +713,47 @@ class SpringleCircle:
                         group.color_transition
                     )
                     size = self.calculate_circle_size(
-                        circle['motion'].radius,
+                        radius,
                         circle['base_size'],
                         circle['size_variation']
                     )
-                    
-                    group_elements[group.creation_time].append({
-                        'type': 'circle',
-                        'x': x,
-                        'y': y,
-                        'color': color,
-                        'size': size,
-                        'alpha': 255
-                    })
-        
-        # Draw all elements in order of creation time
-        for creation_time in sorted(group_elements.keys()):
-            for element in group_elements[creation_time]:
-                gradient_surface = self._get_cached_gradient(
-                    element['size'],
-                    element['color'],
-                    element['alpha']
-                )
-                screen.blit(gradient_surface, (
-                    element['x'] - element['size'],
-                    element['y'] - element['size']
-                ))
\ No newline at end of file
+                    heads.append((x, y, color, size, group.creation_time))
+        
+        head_x, head_y, head_rgb, head_size, head_time = zip(*heads) if heads else ((),) * 5
+        group_time = np.concatenate((columns['group_time'][visible], head_time))
+        is_head = np.arange(len(group_time)) >= len(group_time) - len(heads)
+        
+        # Stable sort keeps trails chronological and heads in group order
+        order = np.lexsort((is_head, group_time))
+        return {
+            'x': np.concatenate((columns['x'][visible], head_x))[order],
+            'y': np.concatenate((columns['y'][visible], head_y))[order],
+            'rgb': np.concatenate((columns['rgb'][visible],
+                                   np.array(head_rgb, dtype=np.uint8).reshape(-1, 3)))[order],
+            'size': np.concatenate((columns['size'][visible], head_size))[order],
+            'alpha': np.concatenate((buckets[visible], np.full(len(heads), 255)))[order],
+        }
+    
+    def draw_columns(self, screen, columns):
+        """
+        Blit columns from get_drawable_columns onto the screen in one batch.
+        
+        Args:
+            screen (pygame.Surface): Target surface
+            columns: Dict of arrays, or a structured array with the same fields
+        """
+        get_gradient = self._get_cached_gradient
+        blit_sequence(screen, [
+            (get_gradient(size, tuple(color), alpha), (x - size, y - size))
+            for x, y, color, size, alpha in zip(
+                columns['x'].tolist(), columns['y'].tolist(), columns['rgb'].tolist(),
+                columns['size'].tolist(), columns['alpha'].tolist())
+        ])
+    
+    def draw(self, screen, max_alpha):
+        """Draw all groups and their trails with proper creation time ordering."""
+        if self.render_mode == 'accumulate':
+            self._draw_accumulated(screen, max_alpha)
+            return
+        
+        self.draw_columns(screen, self.get_drawable_columns(max_alpha))
@@ -1,11 +1,19 @@
 import pygame
 import numpy as np
 from pygame import Surface, SRCALPHA
-from typing import Tuple, List, Dict
+from typing import Tuple
 import moderngl
 from lib.SpringleCircle import SpringleCircle
+from lib.TrailFade import fade_alphas
 import math
 
+# Per-instance attributes, laid out to match the '2f 4f 1f/i' vertex array format
+INSTANCE = np.dtype([
+    ('center', 'f4', 2),
+    ('color', 'f4', 4),
+    ('size', 'f4'),
+])
+
 class GPUCircleRenderer:
     def __init__(self, window_size: Tuple[int, int]):
         self.window_size = window_size
@@ -86,10 +94,30 @@ class GPUCircleRenderer:
         
         self.vbo = self.ctx.buffer(vertices.tobytes())
         
-        self.max_instances = 10000
-        self.instance_data = np.zeros(self.max_instances * 7, dtype='f4')
-        self.instance_buffer = self.ctx.buffer(self.instance_data.tobytes())
+        self.max_instances = 0
+        self.instance_buffer = None
+        self.vao = None
+        self._reserve(10000)
+        
+        # Create high-resolution texture and framebuffer
+        self.texture = self.ctx.texture(self.scaled_size, 4)
+        self.fbo = self.ctx.framebuffer(color_attachments=[self.texture])
+    
+    def _reserve(self, count: int) -> None:
+        """Make room for count instances, doubling the instance buffer as needed."""
+        if count <= self.max_instances:
+            return
         
+        max_instances = max(self.max_instances, 1)
+        while max_instances < count:
+            max_instances *= 2
+        
+        if self.vao is not None:
+            self.vao.release()
+            self.instance_buffer.release()
+        self.max_instances = max_instances
+        self.instance_data = np.zeros(max_instances, dtype=INSTANCE)
+        self.instance_buffer = self.ctx.buffer(reserve=max_instances * INSTANCE.itemsize)
         self.vao = self.ctx.vertex_array(
             self.prog,
             [
@@ -97,13 +125,23 @@ class GPUCircleRenderer:
                 (self.instance_buffer, '2f 4f 1f/i', 'in_center', 'in_color', 'in_size'),
             ]
         )
-        
-        # Create high-resolution texture and framebuffer
-        self.texture = self.ctx.texture(self.scaled_size, 4)
-        self.fbo = self.ctx.framebuffer(color_attachments=[self.texture])
     
-    def render(self, circles: List[Dict], background_color: Tuple[int, int, int, int]) -> Surface:
-        """Render circles at high resolution and return scaled surface."""
+    def render(self, x: np.ndarray, y: np.ndarray, rgb: np.ndarray, alpha: np.ndarray,
+               size: np.ndarray, background_color: Tuple[int, int, int, int]) -> Surface:
+        """
+        Render circles at high resolution and return scaled surface.
+        
+        Args:
+            x (np.ndarray): Center x of each circle
+            y (np.ndarray): Center y of each circle
+            rgb (np.ndarray): Color of each circle, shape (n, 3), 0-255
+            alpha (np.ndarray): Alpha of each circle, 0-255
+            size (np.ndarray): Radius of each circle
+            background_color (tuple): RGBA color to clear to
+            
+        Returns:
+            Surface: The circles drawn in order, scaled to the window size
+        """
         self.fbo.use()
         
         self.ctx.enable(moderngl.BLEND)
@@ -117,19 +155,19 @@ class GPUCircleRenderer:
             background_color[3]/255
         )
         
-        if circles:
-            # Update instance data
-            num_circles = min(len(circles), self.max_instances)
-            for i, circle in enumerate(circles[:num_circles]):
-                idx = i * 7
-                self.instance_data[idx:idx+7] = [
-                    circle['x'], circle['y'],
-                    circle['color'][0]/255, circle['color'][1]/255,
-                    circle['color'][2]/255, circle['alpha']/255,
-                    circle['size']
-                ]
+        num_circles = len(x)
+        if num_circles:
+            # Fill the instance data column by column
+            self._reserve(num_circles)
+            data = self.instance_data[:num_circles]
+            data['center'][:, 0] = x
+            data['center'][:, 1] = y
+            data['color'][:, :3] = rgb * np.float32(1 / 255)
+            data['color'][:, 3] = alpha * np.float32(1 / 255)
+            data['size'] = size
             
-            self.instance_buffer.write(self.instance_data.tobytes())
+            # Upload only the live instances
+            self.instance_buffer.write(data, offset=0)
             self.vao.render(moderngl.TRIANGLE_FAN, instances=num_circles)
         
         # Read pixels at high resolution
@@ -167,46 +205,20 @@ class GPUAcceleratedSpingleCircle(SpringleCircle):
         
     def draw(self, screen, max_alpha):
         # Same as before, but with adjusted alpha handling
-        drawable_elements = []
-        
-        # Collect fade trails with improved alpha calculation
-        for creation_time, (x, y, color, size, age) in self.fading_trails:
-            fade_progress = age / self.fade_duration
-            # Improved easing function for smoother fade
-            eased_fade = 1 - (fade_progress * fade_progress)
-            alpha = int(max(0, max_alpha * eased_fade))
-            
-            if alpha > 0:
-                drawable_elements.append({
-                    'x': x,
-                    'y': y,
-                    'color': color,
-                    'size': size,
-                    'alpha': alpha
-                })
-        
-        # Add active group trails and circles
-        for group in sorted(self.groups, key=lambda g: g.creation_time):
+        
+        # Collect visible trail points, using a quadratic easing for a smoother fade
+        columns = self.trails.columns()
+        alphas, visible = fade_alphas(self.trails.ages(self.simulation_time),
+                                      self.fade_duration, max_alpha, power=2)
+        visible &= self.on_screen_mask(columns['x'], columns['y'], columns['size'])
+        
+        # Collect the current circles of active groups
+        heads = []
+        for group in self.groups:
             if not group.active:
                 continue
             
             for circle in group.circles:
-                # Add trails with improved alpha blending
-                for x, y, color, size, age, _ in circle['trail']:
-                    fade_progress = age / self.fade_duration
-                    eased_fade = 1 - (fade_progress * fade_progress)
-                    alpha = int(max(0, max_alpha * eased_fade))
-                    
-                    if alpha > 0:
-                        drawable_elements.append({
-                            'x': x,
-                            'y': y,
-                            'color': color,
-                            'size': size,
-                            'alpha': alpha
-                        })
-                
-                # Add current circle
                 x, y = group.get_circle_cartesian_pos(circle, self.center)
                 if (0 <= x <= self.WIDTH * 1.2 and 0 <= y <= self.HEIGHT * 1.2):
                     color = self.colors.getColor(
@@ -219,20 +231,33 @@ class GPUAcceleratedSpingleCircle(SpringleCircle):
                         circle['base_size'],
                         circle['size_variation']
                     )
-                    
-                    drawable_elements.append({
-                        'x': x,
-                        'y': y,
-                        'color': color,
-                        'size': size,
-                        'alpha': 255
-                    })
+                    heads.append((x, y, color, size, group.creation_time))
+        
+        head_x, head_y, head_rgb, head_size, head_time = (
+            [np.array(values) for values in zip(*heads)] if heads
+            else [np.empty(0), np.empty(0), np.empty((0, 3)), np.empty(0), np.empty(0)]
+        )
+        x = np.concatenate((columns['x'][visible], head_x))
+        y = np.concatenate((columns['y'][visible], head_y))
+        rgb = np.concatenate((columns['rgb'][visible], head_rgb))
+        alpha = np.concatenate((alphas[visible], np.full(len(heads), 255)))
+        size = np.concatenate((columns['size'][visible], head_size))
+        group_time = np.concatenate((columns['group_time'][visible], head_time))
+        is_head = np.arange(len(x)) >= len(x) - len(heads)
+        
+        # Trails of removed groups are drawn first, then each active group's
+        # trails followed by its circles, in order of creation time
+        active_times = [group.creation_time for group in self.groups if group.active]
+        active = np.isin(group_time, active_times)
+        order = np.lexsort((is_head, group_time, active))
         
         # Get background color
         bg_color = screen.get_at((0, 0))
         
         # Render high-resolution circles
-        rendered_surface = self.gpu_renderer.render(drawable_elements, bg_color)
+        rendered_surface = self.gpu_renderer.render(
+            x[order], y[order], rgb[order], alpha[order], size[order], bg_color
+        )
         
         # Blit to screen
         screen.blit(rendered_surface, (0, 0))
@@ -1,6 +1,24 @@
 # springle_params.py
 from dataclasses import dataclass
 
+# Settings the Springle app starts with, keyed like its option sliders. Shared
+# by the app, the frame exporter and the benchmark.
+DEFAULT_SETTINGS = {
+    'min_circles': 4,
+    'max_circles': 12,
+    'angular_acceleration': 0.5,
+    'radial_acceleration': 3,
+    'starting_angular_velocity': 1.0,
+    'starting_radial_velocity': 25,
+    'base_size': 20,
+    'fade_duration': 5.0,
+    'max_alpha': 200,
+    'trail_spacing': 0.5,
+    'color_transition_speed': 0.2,
+    'max_groups': 10,
+    'spawn_cooldown': 2.5
+}
+
 @dataclass
 class SpringleParams:
     """Parameters for SpringleCircle update."""
@@ -16,6 +34,8 @@ class SpringleParams:
     fade_duration: float
     space_factor: float
     auto_generate: bool = True
+    max_groups: int = 10
+    max_alpha: int = 200
 
     @classmethod
     def from_defaults(cls):
@@ -32,4 +52,38 @@ class SpringleParams:
             mouse_pos=(0, 0),
             fade_duration=2.0,
             space_factor=0.5
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_settings(cls, settings=None, mouse_button_pressed=False, mouse_pos=(0, 0),
+                      auto_generate=True):
+        """
+        Create an instance from app settings.
+
+        Args:
+            settings (dict): Values keyed like DEFAULT_SETTINGS, DEFAULT_SETTINGS if None
+            mouse_button_pressed (bool): Whether the mouse button is held
+            mouse_pos (tuple): Current mouse position
+            auto_generate (bool): Whether new groups spawn automatically
+
+        Returns:
+            SpringleParams: Parameters for SpringleCircle.update
+        """
+        if settings is None:
+            settings = DEFAULT_SETTINGS
+        return cls(
+            min_circles=settings['min_circles'],
+            max_circles=settings['max_circles'],
+            radial_velocity=settings['starting_radial_velocity'],
+            angular_velocity=settings['starting_angular_velocity'],
+            radial_acceleration=settings['radial_acceleration'],
+            angular_acceleration=settings['angular_acceleration'],
+            base_size=settings['base_size'],
+            mouse_button_pressed=mouse_button_pressed,
+            mouse_pos=mouse_pos,
+            fade_duration=settings['fade_duration'],
+            space_factor=settings['trail_spacing'],
+            auto_generate=auto_generate,
+            max_groups=settings['max_groups'],
+            max_alpha=settings['max_alpha']
+        )
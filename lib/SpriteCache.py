@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+
+class SpriteCache:
+    """
+    Least-recently-used cache with a byte budget.
+
+    Entries are charged by a sizeof callable, e.g. width * height * bytes per
+    pixel of a surface or texture, and the least recently used entries are
+    evicted until the total fits the budget. Hit, miss and eviction counters
+    are kept for monitoring.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, sizeof=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Total size of cached values before eviction
+            sizeof (callable): Returns the size in bytes of a cached value;
+                every value counts as 1 byte when omitted
+        """
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 1)
+        self._entries = OrderedDict()  # key -> (value, nbytes), oldest first
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Get a cached value and mark it as recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key, value):
+        """
+        Cache a value, evicting least recently used entries to stay in budget.
+
+        Values larger than the whole budget are not cached.
+        """
+        nbytes = self.sizeof(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        if nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+        self._evict()
+
+    def set_max_bytes(self, max_bytes):
+        """Change the budget, evicting immediately if it shrank."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until within budget."""
+        while self.bytes_used > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.bytes_used -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every entry. Counters are kept."""
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        """
+        Get cache counters for monitoring.
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes_used,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
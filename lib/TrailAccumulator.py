@@ -0,0 +1,116 @@
+import pygame
+
+
+class TrailAccumulator:
+    """
+    Persistent offscreen layers for trail rendering.
+
+    Instead of re-blitting every live trail point each frame, new points are
+    stamped once onto the layer covering their creation time. Each layer spans
+    fade_duration / layer_count seconds and is blended onto the screen with a
+    single alpha multiply taken from the cubic fade curve at the layer's mid
+    age, so per-frame cost is the number of new points plus one blit per layer.
+    The oldest layer is cleared and reused once its points have fully faded.
+
+    Redrawing fades every point before blending, so where points of a trail
+    overlap their faded alphas compound; a layer has already merged its
+    overlapping points at full alpha. composite corrects the layer alpha for
+    the typical number of overlapping points, which keeps the result close to
+    redrawing every point (see test/test_trail_accumulator.py).
+    """
+
+    def __init__(self, size, layer_count=8):
+        """
+        Initialize the accumulation layers.
+
+        Args:
+            size (tuple): (width, height) of the layers
+            layer_count (int): Number of age slices; more layers follow the
+                cubic easing more closely at the cost of memory and blits
+        """
+        self.size = size
+        self.layer_count = max(2, int(layer_count))
+        self.layers = [pygame.Surface(size, pygame.SRCALPHA) for _ in range(self.layer_count)]
+        self.layer_starts = [0.0] * self.layer_count  # Oldest first, parallel to layers
+        self.slice_duration = 0.0
+
+    def reset(self, current_time, fade_duration):
+        """Clear all layers and align their time slices to end at current_time."""
+        self.slice_duration = fade_duration / self.layer_count
+        for i, layer in enumerate(self.layers):
+            layer.fill((0, 0, 0, 0))
+            self.layer_starts[i] = current_time - (self.layer_count - 1 - i) * self.slice_duration
+
+    def advance(self, current_time, fade_duration):
+        """Recycle the oldest layers once the newest slice has elapsed."""
+        if self.slice_duration <= 0:
+            self.reset(current_time, fade_duration)
+            return
+
+        while current_time - self.layer_starts[-1] >= self.slice_duration:
+            # Slice length follows fade_duration changes on rotation
+            next_start = self.layer_starts[-1] + self.slice_duration
+            self.slice_duration = fade_duration / self.layer_count
+            if current_time - next_start >= fade_duration:
+                # Nothing left alive, e.g. after a long pause
+                self.reset(current_time, fade_duration)
+                return
+
+            oldest = self.layers.pop(0)
+            self.layer_starts.pop(0)
+            oldest.fill((0, 0, 0, 0))
+            self.layers.append(oldest)
+            self.layer_starts.append(next_start)
+
+    def stamp(self, surface, pos, creation_time):
+        """
+        Draw a sprite onto the layer covering creation_time.
+
+        Args:
+            surface (pygame.Surface): Sprite at full trail alpha
+            pos (tuple): Top-left screen position
+            creation_time (float): Simulation time the point was created
+        """
+        for i in range(self.layer_count - 1, -1, -1):
+            if creation_time >= self.layer_starts[i]:
+                self.layers[i].blit(surface, pos)
+                return
+        # Older than every layer: already faded out
+
+    def composite(self, screen, current_time, fade_duration, stamp_alpha=255, overlap=1.0):
+        """
+        Blend all layers onto the screen, oldest first.
+
+        Args:
+            screen (pygame.Surface): Target surface
+            current_time (float): Current simulation time
+            fade_duration (float): Seconds for a point to fade out
+            stamp_alpha (float): Mean alpha of the stamped sprites, 0-255
+            overlap (float): Typical number of stamped points covering a pixel;
+                1 multiplies each layer by the plain fade
+        """
+        coverage = min(stamp_alpha / 255, 0.999)
+        overlap = max(1.0, overlap)
+        full_coverage = 1 - (1 - coverage) ** overlap
+        for i, layer in enumerate(self.layers):
+            start = self.layer_starts[i]
+            end = min(start + self.slice_duration, current_time)
+            if end <= start:
+                continue
+
+            # Cubic easing evaluated at the mid age of the slice
+            fade_progress = min(1.0, (current_time - (start + end) / 2) / fade_duration)
+            eased_fade = 1 - (fade_progress * fade_progress * fade_progress)
+
+            # Coverage of overlapping points each faded by eased_fade, relative
+            # to the coverage they were stamped with
+            faded_coverage = 1 - (1 - eased_fade * coverage) ** overlap
+            alpha = int(255 * faded_coverage / full_coverage)
+            if alpha > 0:
+                layer.set_alpha(alpha)
+                screen.blit(layer, (0, 0))
+
+    def clear(self):
+        """Erase all accumulated trails."""
+        for layer in self.layers:
+            layer.fill((0, 0, 0, 0))
@@ -0,0 +1,64 @@
+import numpy as np
+
+# Most points a single circle emits in one frame, bounds the work after a
+# long jump such as a dragged group being thrown
+MAX_POINTS_PER_FRAME = 32
+
+
+def emit_trail_points(xs, ys, last_xs, last_ys, spacing, max_points=MAX_POINTS_PER_FRAME):
+    """
+    Decide the trail points of a whole column of circles in one pass.
+
+    A circle emits one point for every full spacing it moved since its last
+    emitted point, evenly spread along the straight line to its current
+    position, so fast circles leave no gaps. The last point is always the
+    current position. Circles with no previous point (NaN) emit exactly at
+    their current position.
+
+    Args:
+        xs (np.ndarray): Current x of each circle
+        ys (np.ndarray): Current y of each circle
+        last_xs (np.ndarray): x of each circle's last emitted point, NaN if
+            none; updated in place for circles that emit
+        last_ys (np.ndarray): y of each circle's last emitted point, NaN if
+            none; updated in place for circles that emit
+        spacing (np.ndarray): Minimum distance between points of each circle;
+            0 emits one point every call
+        max_points (int): Cap on the points a circle emits per call
+
+    Returns:
+        tuple: (index, px, py) where index is the circle of each emitted point,
+        ordered by circle and then along its path
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    spacing = np.broadcast_to(np.asarray(spacing, dtype=np.float64), xs.shape)
+
+    dx = xs - last_xs
+    dy = ys - last_ys
+    distance = np.hypot(dx, dy)
+    fresh = np.isnan(distance)
+
+    counts = np.ones(len(xs), dtype=np.int64)
+    spaced = (spacing > 0) & ~fresh
+    counts[spaced] = np.minimum(distance[spaced] // spacing[spaced], max_points)
+
+    index = np.repeat(np.arange(len(xs)), counts)
+    if len(index) == 0:
+        return index, np.empty(0), np.empty(0)
+
+    # Position of each point along its step, 1 being the current position
+    starts = np.cumsum(counts) - counts
+    step = np.arange(len(index)) - np.repeat(starts, counts) + 1
+    remaining = 1.0 - step / counts[index]
+
+    # Step back from the current position so the final point lands on it exactly
+    step_dx = np.where(fresh, 0.0, dx)[index]
+    step_dy = np.where(fresh, 0.0, dy)[index]
+    px = xs[index] - remaining * step_dx
+    py = ys[index] - remaining * step_dy
+
+    emitted = counts > 0
+    last_xs[emitted] = xs[emitted]
+    last_ys[emitted] = ys[emitted]
+    return index, px, py
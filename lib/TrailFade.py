@@ -0,0 +1,38 @@
+import numpy as np
+
+
+def fade_alphas(ages, fade_duration, max_alpha, power=3, alpha_step=None):
+    """
+    Compute trail alphas for a whole column of ages in one pass.
+
+    Matches the scalar form used by the renderers,
+    int(max(0, max_alpha * (1 - (age / fade_duration) ** power))).
+
+    Args:
+        ages (np.ndarray): Seconds since each point was created
+        fade_duration (float): Seconds for a point to fade out completely
+        max_alpha (int): Alpha of a brand new point
+        power (int): Easing exponent, 3 for the cubic sprite fade and 2 for
+            the quadratic GPU fade
+        alpha_step (int): Quantization step of the gradient cache; when given,
+            the cache buckets are returned as well
+
+    Returns:
+        tuple: (alphas, visible) int32 alphas and a mask of points whose alpha
+        is above zero, plus the alphas rounded to the nearest multiple of
+        alpha_step (capped at 255) when alpha_step is given
+    """
+    progress = np.clip(np.asarray(ages, dtype=np.float64) / fade_duration, 0.0, 1.0)
+
+    # Repeated multiplication rounds exactly like the scalar expression
+    eased = progress.copy()
+    for _ in range(power - 1):
+        eased *= progress
+    alphas = (max_alpha * (1.0 - eased)).astype(np.int32)
+    visible = alphas > 0
+
+    if alpha_step is None:
+        return alphas, visible
+
+    buckets = np.minimum(255, np.round(alphas / alpha_step) * alpha_step).astype(np.int32)
+    return alphas, visible, buckets
@@ -0,0 +1,251 @@
+import numpy as np
+
+
+class TrailRing:
+    """
+    Columnar ring buffer holding every trail point of a SpringleCircle.
+    Points are appended in creation-time order, so expiry only ever advances
+    the tail index and ages are derived from the creation time on demand
+    instead of being rewritten every frame.
+
+    Aging points can be thinned out in place with decimate, which keeps the
+    chronological order.
+    """
+
+    # Column name -> (dtype, trailing shape)
+    COLUMNS = {
+        'x': (np.float64, ()),
+        'y': (np.float64, ()),
+        'rgb': (np.uint8, (3,)),
+        'size': (np.float64, ()),
+        'creation_time': (np.float64, ()),
+        'group_time': (np.float64, ()),  # Creation time of the owning group, used for draw order
+        'emit_index': (np.int64, ()),    # Running count of points emitted by the same circle
+    }
+
+    def __init__(self, capacity=4096):
+        """
+        Initialize the ring with pre-allocated columns.
+
+        Args:
+            capacity (int): Initial number of points, doubled when full
+        """
+        self.capacity = max(1, int(capacity))
+        self._columns = {
+            name: np.zeros((self.capacity,) + shape, dtype=dtype)
+            for name, (dtype, shape) in self.COLUMNS.items()
+        }
+        self.tail = 0   # Index of the oldest point
+        self.count = 0  # Number of live points
+        self.total_appended = 0  # Running total, lets consumers find points added since a mark
+        self._lod_cutoffs = []  # Newest creation time already decimated, per decimate level
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def head(self):
+        """Index where the next point will be written."""
+        return (self.tail + self.count) % self.capacity
+
+    def _grow(self):
+        """Double the capacity, unrolling live points to the front."""
+        new_capacity = self.capacity * 2
+        columns = self.columns()
+        for name, (dtype, shape) in self.COLUMNS.items():
+            new = np.zeros((new_capacity,) + shape, dtype=dtype)
+            new[:self.count] = columns[name]
+            self._columns[name] = new
+        self.capacity = new_capacity
+        self.tail = 0
+
+    def append(self, x, y, color, size, creation_time, group_time, emit_index=0):
+        """
+        Add a single trail point.
+
+        Args:
+            x (float): Screen x coordinate
+            y (float): Screen y coordinate
+            color (tuple): RGB color
+            size (float): Circle size at creation
+            creation_time (float): Simulation time the point was created
+            group_time (float): Creation time of the owning group
+            emit_index (int): Running count of points emitted by the same circle
+        """
+        if self.count == self.capacity:
+            self._grow()
+
+        i = self.head
+        columns = self._columns
+        columns['x'][i] = x
+        columns['y'][i] = y
+        columns['rgb'][i] = color
+        columns['size'][i] = size
+        columns['creation_time'][i] = creation_time
+        columns['group_time'][i] = group_time
+        columns['emit_index'][i] = emit_index
+        self.count += 1
+        self.total_appended += 1
+
+    def extend(self, x, y, rgb, size, creation_time, group_time, emit_index=0):
+        """
+        Add many trail points at once.
+
+        Args:
+            x (np.ndarray): Screen x coordinates
+            y (np.ndarray): Screen y coordinates
+            rgb (np.ndarray): RGB colors, shape (n, 3)
+            size (np.ndarray): Circle sizes at creation
+            creation_time (float or np.ndarray): Simulation time the points were created
+            group_time (np.ndarray): Creation times of the owning groups
+            emit_index (np.ndarray): Running count of points emitted by each point's circle
+        """
+        n = len(x)
+        if n == 0:
+            return
+        while self.count + n > self.capacity:
+            self._grow()
+
+        values = {'x': x, 'y': y, 'rgb': rgb, 'size': size,
+                  'creation_time': creation_time, 'group_time': group_time,
+                  'emit_index': emit_index}
+        start = self.head
+        first = min(n, self.capacity - start)
+        for name, column in self._columns.items():
+            value = np.broadcast_to(values[name], (n,) + column.shape[1:])
+            column[start:start + first] = value[:first]
+            column[:n - first] = value[first:]
+        self.count += n
+        self.total_appended += n
+
+    def _count_created_by(self, time):
+        """Count the live points created at or before time."""
+        # Live points are chronological, so they form a prefix found by
+        # binary search over at most two contiguous segments
+        creation_time = self._columns['creation_time']
+        end = self.tail + self.count
+        first = creation_time[self.tail:min(end, self.capacity)]
+        found = int(np.searchsorted(first, time, side='right'))
+        if found == len(first) and end > self.capacity:
+            found += int(np.searchsorted(creation_time[:end - self.capacity], time, side='right'))
+        return found
+
+    def expire(self, current_time, fade_duration):
+        """
+        Drop points older than fade_duration by advancing the tail.
+
+        Returns:
+            int: Number of points removed
+        """
+        if self.count == 0:
+            return 0
+
+        removed = self._count_created_by(current_time - fade_duration)
+        self.count -= removed
+        # Restart at the front once empty so the live range rarely wraps
+        self.tail = (self.tail + removed) % self.capacity if self.count else 0
+        return removed
+
+    def trim(self, max_count):
+        """
+        Drop the oldest points beyond max_count.
+
+        Returns:
+            int: Number of points removed
+        """
+        removed = max(0, self.count - max_count)
+        if removed:
+            self.count -= removed
+            self.tail = (self.tail + removed) % self.capacity if self.count else 0
+        return removed
+
+    def decimate(self, current_time, fade_duration, levels):
+        """
+        Thin out aging points in place.
+
+        Once a point is older than fraction * fade_duration it is only kept if
+        its emit_index is a multiple of stride, so every circle's trail keeps
+        evenly spaced points. Each point is checked once per level, when it
+        crosses the level's age.
+
+        Args:
+            current_time (float): Current simulation time
+            fade_duration (float): Seconds for a point to fade out completely
+            levels (tuple): (fraction, stride) pairs, by increasing fraction
+
+        Returns:
+            int: Number of points removed
+        """
+        if len(self._lod_cutoffs) != len(levels):
+            self._lod_cutoffs = [-np.inf] * len(levels)
+        if self.count == 0:
+            return 0
+
+        # Points are chronological, so those crossing a level form a range
+        keep = None
+        end = 0
+        for i, (fraction, stride) in enumerate(levels):
+            cutoff = current_time - fraction * fade_duration
+            start = self._count_created_by(self._lod_cutoffs[i])
+            stop = self._count_created_by(cutoff)
+            self._lod_cutoffs[i] = max(self._lod_cutoffs[i], cutoff)
+            if stop <= start:
+                continue
+
+            indices = (self.tail + np.arange(start, stop)) % self.capacity
+            crossing = self._columns['emit_index'][indices] % stride == 0
+            if crossing.all():
+                continue
+            if keep is None:
+                keep = np.ones(self.count, dtype=bool)
+            keep[start:stop] &= crossing
+            end = max(end, stop)
+
+        if keep is None:
+            return 0
+
+        # Shift the kept older points up against the newer ones and advance the tail
+        kept = keep[:end]
+        removed = end - int(np.count_nonzero(kept))
+        indices = (self.tail + np.arange(end)) % self.capacity
+        for column in self._columns.values():
+            column[indices[removed:]] = column[indices[kept]]
+        self.tail = (self.tail + removed) % self.capacity
+        self.count -= removed
+        return removed
+
+    def _segment(self, start, count):
+        """Get count points starting at buffer index start, unrolled if they wrap."""
+        end = start + count
+        if end <= self.capacity:
+            return {name: column[start:end] for name, column in self._columns.items()}
+
+        wrapped = end - self.capacity
+        return {
+            name: np.concatenate((column[start:], column[:wrapped]))
+            for name, column in self._columns.items()
+        }
+
+    def columns(self):
+        """
+        Get live points in chronological order.
+
+        Returns:
+            dict: Column name -> array. Views when the live range is contiguous,
+            copies when it wraps around the end of the buffer.
+        """
+        return self._segment(self.tail, self.count)
+
+    def newest(self, count):
+        """Get the count most recently added live points, oldest first."""
+        count = max(0, min(count, self.count))
+        return self._segment((self.head - count) % self.capacity, count)
+
+    def ages(self, current_time):
+        """Get the age of every live point, oldest first."""
+        return current_time - self.columns()['creation_time']
+
+    def clear(self):
+        """Remove all points without releasing the buffers."""
+        self.tail = 0
+        self.count = 0
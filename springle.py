@@ -7,35 +7,44 @@ Copyright (c) 2024 Jason Stumfoll
 import pygame
 import pygame_gui
 from datetime import datetime
+import argparse
+import contextlib
 import os
+import random
 
 from lib.BackgroundColorManager import BackgroundColorManager
 # from lib.SpringleGPU import  GPUAcceleratedSpingleCircle as SpringleCircle
 from lib.SpringleCircle import  SpringleCircle
 from lib.FPSCounter import FPSCounter
-from lib.SpringleParams import SpringleParams
-from lib.OrbitGroup import OrbitGroup
+from lib.FixedTimestep import FixedTimestep
+from lib.QualityGovernor import QualityGovernor
+from lib.SimulationThread import SimulationThread
+from lib.SimulationProcess import SimulationProcess
+from lib.SpringleParams import DEFAULT_SETTINGS, SpringleParams
+from lib.SceneRecorder import SceneRecorder, SceneReplayer
 
 class Springle:
     # Default parameter values
-    DEFAULT_VALUES = {
-        'min_circles': 4,
-        'max_circles': 12,
-        'angular_acceleration': 0.5,
-        'radial_acceleration': 3,
-        'starting_angular_velocity': 1.0,
-        'starting_radial_velocity': 25,
-        'base_size': 20,
-        'fade_duration': 5.0,
-        'max_alpha': 200,
-        'trail_spacing': 0.5,
-        'color_transition_speed': 0.2,
-        'max_groups': 10,
-        'spawn_cooldown': 2.5
-    }
+    DEFAULT_VALUES = DEFAULT_SETTINGS
 
-    def __init__(self, width=1080, height=1080):
-        """Initialize the Springle application."""
+    def __init__(self, width=1080, height=1080, record_path=None, seed=None, simulation_rate=60,
+                 simulation_mode='inline', target_fps=None):
+        """
+        Initialize the Springle application.
+
+        Args:
+            width (int): Window width
+            height (int): Window height
+            record_path (str): Record the session to this file for replay
+            seed (int): RNG seed, random when recording without one
+            simulation_rate (float): Fixed simulation steps per second,
+                independent of the display frame rate
+            simulation_mode (str): 'inline' to simulate in the render loop,
+                'thread' for a background thread or 'process' for a child
+                process; the latter two draw the latest published snapshot
+            target_fps (float): Lower rendering quality as needed to hold this
+                frame rate, None to always draw at full quality
+        """
         self.width = width
         self.height = height
         self.running = True
@@ -63,7 +72,14 @@ class Springle:
         
         # Initialize game components
         self.fps_counter = FPSCounter()
-        self.circle_system = SpringleCircle(
+        
+        # Seed right before the circle system so a recording can recreate it
+        if record_path and seed is None:
+            seed = random.randrange(2**32)
+        if seed is not None:
+            random.seed(seed)
+        
+        circle_args = (
             self.settings['min_circles'],
             self.settings['max_circles'],
             self.settings['starting_radial_velocity'],
@@ -73,6 +89,7 @@ class Springle:
             self.settings['base_size'],
             width, height
         )
+        self.circle_system = SpringleCircle(*circle_args)
         
         # Update circle system's color transition speed from default values
         self.circle_system.color_transition_speed = self.settings['color_transition_speed']
@@ -80,9 +97,32 @@ class Springle:
         self.circle_system.spawn_cooldown_current = self.settings['spawn_cooldown']
         self.circle_system.set_max_groups(self.settings['max_groups'])
         
+        self.recorder = None
+        if record_path and simulation_mode == 'process':
+            print("Recording is not supported when simulating in a separate process")
+        elif record_path:
+            self.recorder = SceneRecorder(record_path, seed, circle_args, self.circle_system)
+        
         # Game state
         self.mouse_button_pressed = False
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(simulation_rate)
+        
+        # Optional adaptive quality, driven by the frame work time
+        self.governor = None
+        if target_fps:
+            self.governor = QualityGovernor(self.circle_system, target_fps)
+        
+        # Optional background simulation; UI handlers hold its lock while they
+        # change the circle system
+        self.simulation = None
+        if simulation_mode == 'thread':
+            self.simulation = SimulationThread(self.circle_system, self.step_simulation,
+                                               simulation_rate)
+        elif simulation_mode == 'process':
+            # The local circle system only holds settings and draws the frames
+            self.simulation = SimulationProcess(self.circle_system, circle_args,
+                                                simulation_rate, seed)
         
         # Create fonts
         if not hasattr(pygame, 'mouse_pos_font'):
@@ -282,6 +322,8 @@ class Springle:
                     self.toggle_options_menu()
                 elif event.key == pygame.K_c:  # Add new keyboard command
                     self.clear_groups()
+                elif event.key == pygame.K_a:
+                    self.circle_system.toggle_render_mode()
             
             # Handle mouse events if not over UI
             if not ui_hover:
@@ -348,6 +390,9 @@ class Springle:
     def toggle_pause(self):
         """Toggle the pause state."""
         self.paused = not self.paused
+        self.timestep.reset()
+        if self.simulation is not None:
+            self.simulation.paused = self.paused
         # Update pause button text
         self.buttons['pause'].set_text('Resume' if self.paused else 'Pause')
 
@@ -359,37 +404,31 @@ class Springle:
             'Enable Auto Generation' if not self.auto_generate_groups else 'Disable Auto Generation'
         )
 
+    def apply_action(self, name):
+        """
+        Apply a group action, logging it for replay when recording.
+
+        Args:
+            name (str): One of SceneReplayer.ACTIONS
+        """
+        if isinstance(self.simulation, SimulationProcess):
+            self.simulation.send_action(name)
+            return
+        if self.recorder is not None:
+            self.recorder.record_action(name)
+        SceneReplayer.ACTIONS[name](self.circle_system, self.build_params())
+
     def clear_trails(self):
         """Clear all trail points."""
-        self.circle_system.fading_trails = []
-        for group in self.circle_system.groups:
-            for circle in group.circles:
-                circle['trail'] = []
-                circle['last_trail_pos'] = None
+        self.apply_action('clear_trails')
 
     def create_new_group(self):
         """Create a new orbit group."""
-        new_group = OrbitGroup(
-            self.settings['min_circles'],
-            self.settings['max_circles'],
-            0,
-            self.settings['base_size'],
-            self.settings['starting_radial_velocity'],
-            self.settings['starting_angular_velocity'],
-            self.settings['radial_acceleration'],
-            self.settings['angular_acceleration'],
-            False
-        )
-        new_group.creation_time = self.circle_system.simulation_time  # Store creation time
-        self.circle_system.groups.append(new_group)
+        self.apply_action('new_group')
 
     def clear_groups(self):
         """Clear all groups and create a new one."""
-        # Replace all groups with new one
-        self.circle_system.groups = []
-        self.circle_system.fading_trails = []
-        self.circle_system.spawn_cooldown_current = self.circle_system.spawn_cooldown_start
-        self.create_new_group()
+        self.apply_action('clear_groups')
 
     def reset_settings(self):
         """Reset all settings to their default values."""
@@ -412,44 +451,60 @@ class Springle:
         # Reset states
         self.paused = False
         self.auto_generate_groups = True
+        if self.simulation is not None:
+            self.simulation.paused = False
+
+    def build_params(self):
+        """Create a parameters object with the current settings and mouse state."""
+        return SpringleParams.from_settings(
+            self.settings,
+            mouse_button_pressed=self.mouse_button_pressed,
+            mouse_pos=pygame.mouse.get_pos(),
+            auto_generate=self.auto_generate_groups
+        )
+
+    def simulation_lock(self):
+        """Get the context guarding the circle system against the simulation thread."""
+        if self.simulation is not None:
+            return self.simulation.lock
+        return contextlib.nullcontext()
+
+    def step_simulation(self, dt, params):
+        """Advance the circle system by one fixed step."""
+        # Manage group limits, removing oldest non-mouse groups first
+        self.circle_system.enforce_group_limit(self.settings['max_groups'])
+        
+        # Update spawn cooldown in circle system
+        self.circle_system.spawn_cooldown_start = self.settings['spawn_cooldown']
+        
+        # Update circle system with parameter object
+        if self.recorder is not None:
+            self.recorder.record_frame(dt, params)
+        self.circle_system.update(dt, params)
+        if self.recorder is not None:
+            self.recorder.end_frame()
 
     def update(self, time_delta):
         """Update game state."""
         self.manager.update(time_delta)
         
-        if not self.paused:
-            current_mouse_pos = pygame.mouse.get_pos()
-            
-            # Manage group limits
-            if len(self.circle_system.groups) > self.settings['max_groups']:
-                # Remove oldest non-mouse groups first
-                for group in self.circle_system.groups[:]:
-                    if not group.is_mouse_group:
-                        self.circle_system.groups.remove(group)
-                        if len(self.circle_system.groups) <= self.settings['max_groups']:
-                            break
-            
-            # Update spawn cooldown in circle system
-            self.circle_system.spawn_cooldown_start = self.settings['spawn_cooldown']
-            
-            # Create parameters object with current values
-            params = SpringleParams(
-                min_circles=self.settings['min_circles'],
-                max_circles=self.settings['max_circles'],
-                radial_velocity=self.settings['starting_radial_velocity'],
-                angular_velocity=self.settings['starting_angular_velocity'],
-                radial_acceleration=self.settings['radial_acceleration'],
-                angular_acceleration=self.settings['angular_acceleration'],
-                base_size=self.settings['base_size'],
-                mouse_button_pressed=self.mouse_button_pressed,
-                mouse_pos=current_mouse_pos,
-                fade_duration=self.settings['fade_duration'],
-                space_factor=self.settings['trail_spacing'],
-                auto_generate=self.auto_generate_groups
+        if self.simulation is not None:
+            # The simulation steps on its own clock; just pass on the latest input
+            self.simulation.set_params(self.build_params())
+            snapshot = self.simulation.latest()
+            active_groups = snapshot.active_groups if snapshot else 0
+            self.group_counter.set_text(
+                f'Active Groups: {active_groups} / {self.settings["max_groups"]}'
             )
+            return
         
-            # Update circle system with parameter object
-            self.circle_system.update(time_delta, params)
+        if not self.paused:
+            # Run whole fixed steps for the elapsed time, however long the frame was
+            for _ in range(self.timestep.advance(time_delta)):
+                self.step_simulation(self.timestep.step, self.build_params())
+            
+            # Draw current circles between the last two steps
+            self.circle_system.render_alpha = self.timestep.alpha
             
             # Update group counter
             active_groups = sum(1 for group in self.circle_system.groups if group.active)
@@ -461,8 +516,13 @@ class Springle:
         """Draw the game state."""
         self.screen.fill(self.bg_color_manager.get_color())  # Use selected background color
         
-        # Draw circle system
-        self.circle_system.draw(self.screen, self.settings['max_alpha'])
+        # Draw circle system, or the latest snapshot of the simulation thread
+        if self.simulation is not None:
+            snapshot = self.simulation.latest()
+            if snapshot is not None:
+                self.circle_system.draw_columns(self.screen, snapshot.columns)
+        else:
+            self.circle_system.draw(self.screen, self.settings['max_alpha'])
         
         # Draw mouse position
         self.draw_mouse_position()
@@ -489,6 +549,7 @@ class Springle:
             ('Press "o" to toggle options', 'bottomleft', (10, self.height - 30)),
             ('Press "c" to clear all groups', 'bottomleft', (10, self.height - 50)),
             ('Press "space" to pause', 'bottomleft', (10, self.height - 70)),
+            ('Press "a" to toggle trail accumulation', 'bottomleft', (10, self.height - 90)),
         ]
         
         for text, anchor, pos in texts:
@@ -535,20 +596,59 @@ class Springle:
     
     def run(self):
         """Main game loop."""
+        if self.simulation is not None:
+            self.simulation.set_params(self.build_params())
+            self.simulation.start()
+        
         while self.running:
             time_delta = self.clock.tick(60)/1000.0
             
-            self.handle_events()
+            with self.simulation_lock():
+                self.handle_events()
             self.update(time_delta)
             self.draw()
             
             # Update FPS counter
             self.fps_counter.update(time_delta)
+            
+            # Work time of the previous frame, without the frame limiter's wait
+            # Quality changes touch the circle system, so hold the simulation lock
+            if self.governor is not None:
+                with self.simulation_lock():
+                    self.governor.update(self.clock.get_rawtime() / 1000.0, time_delta)
+        
+        if self.simulation is not None:
+            self.simulation.stop()
 
 def main():
     """Entry point for the application."""
-    springle = Springle()
-    springle.run()
+    parser = argparse.ArgumentParser(description='Springle particle animation')
+    parser.add_argument('--record', nargs='?', const='', metavar='PATH',
+                        help='Record the session for replay with "python -m lib.SceneRecorder"')
+    parser.add_argument('--seed', type=int, help='Seed for the random number generator')
+    parser.add_argument('--sim-rate', type=float, default=60,
+                        help='Simulation steps per second, independent of the frame rate')
+    parser.add_argument('--target-fps', type=float,
+                        help='Automatically lower rendering quality to hold this frame rate')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--threaded', dest='simulation_mode', action='store_const', const='thread',
+                      default='inline', help='Run the simulation on a background thread')
+    mode.add_argument('--process', dest='simulation_mode', action='store_const', const='process',
+                      help='Run the simulation in a separate process')
+    args = parser.parse_args()
+    
+    record_path = args.record
+    if record_path == '':
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        record_path = os.path.join(".", "data", "recordings", f"springle_{timestamp}.jsonl.gz")
+    
+    springle = Springle(record_path=record_path, seed=args.seed, simulation_rate=args.sim_rate,
+                        simulation_mode=args.simulation_mode, target_fps=args.target_fps)
+    try:
+        springle.run()
+    finally:
+        if springle.recorder is not None:
+            springle.recorder.close()
     pygame.quit()
 
 if __name__ == '__main__':
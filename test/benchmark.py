@@ -0,0 +1,285 @@
+# test/benchmark.py
+
+"""
+Headless benchmark for the pygame SpringleCircle.
+
+Runs a fixed set of seeded scenarios under the SDL dummy video driver and
+reports update and draw time percentiles separately as JSON, so runs from
+different commits can be diffed directly.
+
+Usage:
+    python test/benchmark.py
+    python test/benchmark.py --frames 900 --scenario fade_30 --output before.json
+    python test/benchmark.py --scenario idle --lod-diff
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Must be set before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import DEFAULT_SETTINGS, SpringleParams
+
+WIDTH = 1080
+HEIGHT = 1080
+DT = 1 / 60
+BACKGROUND = (185, 150, 234)
+PERCENTILES = (50, 90, 95, 99)
+
+# Changes to the app defaults for a busier scene with larger, faster circles
+# and longer trails, so the benchmark stresses trail rendering
+STRESS_SETTINGS = {
+    'min_circles': 6,
+    'starting_radial_velocity': 200,
+    'starting_angular_velocity': 25,
+    'angular_acceleration': 40,
+    'base_size': 25,
+    'fade_duration': 10.0,
+}
+
+# Scenario name -> overrides applied to the app's DEFAULT_SETTINGS. 'idle' is
+# the app as it starts; the others build on STRESS_SETTINGS. 'drag_bursts'
+# additionally drives the mouse, see simulate_drag_burst.
+SCENARIOS = {
+    'idle': {},
+    'stress': STRESS_SETTINGS,
+    'max_groups_20': {**STRESS_SETTINGS, 'max_groups': 20},
+    'fade_30': {**STRESS_SETTINGS, 'fade_duration': 30.0},
+    'drag_bursts': {**STRESS_SETTINGS, 'drag_bursts': True},
+}
+
+
+def scenario_settings(name):
+    """Get the app settings of a scenario, without the benchmark-only keys."""
+    settings = {**DEFAULT_SETTINGS, **SCENARIOS[name]}
+    settings.pop('drag_bursts', None)
+    return settings
+
+
+def simulate_drag_burst(frame, rng, params):
+    """
+    Drive the mouse through repeated press, drag and release bursts.
+
+    Every 30 frames a new group is grabbed at a random position, dragged for
+    10 frames and thrown. Only params are changed; the caller runs the update.
+    """
+    phase = frame % 30
+    if phase == 0:
+        params.mouse_button_pressed = True
+        params.mouse_pos = (rng.randint(0, WIDTH), rng.randint(0, HEIGHT))
+    elif phase <= 10:
+        x, y = params.mouse_pos
+        params.mouse_pos = (x + rng.randint(-100, 100), y + rng.randint(-100, 100))
+    elif phase == 11:
+        params.mouse_button_pressed = False
+
+
+def summarize(samples):
+    """
+    Summarize frame timings.
+
+    Args:
+        samples (list): Frame times in seconds
+
+    Returns:
+        dict: Mean, max and percentiles in milliseconds
+    """
+    times = np.asarray(samples) * 1000.0
+    summary = {
+        'mean_ms': round(float(times.mean()), 4),
+        'max_ms': round(float(times.max()), 4),
+    }
+    for p in PERCENTILES:
+        summary[f'p{p}_ms'] = round(float(np.percentile(times, p)), 4)
+    return summary
+
+
+def run_scenario(name, screen, frames, warmup, seed, render_mode, trail_lod=True):
+    """
+    Run one scenario and time update and draw separately.
+
+    Args:
+        name (str): Key into SCENARIOS
+        screen (pygame.Surface): Target surface
+        frames (int): Number of timed frames
+        warmup (int): Untimed frames run first to populate trails
+        seed (int): RNG seed, applied before the circle system is created
+        render_mode (str): SpringleCircle render mode
+        trail_lod (bool): Keep SpringleCircle's trail decimation enabled
+
+    Returns:
+        dict: Timing summaries and final scene statistics
+    """
+    drag_bursts = SCENARIOS[name].get('drag_bursts', False)
+    settings = scenario_settings(name)
+
+    random.seed(seed)
+    np.random.seed(seed)
+    rng = random.Random(seed)  # Separate stream so mouse input doesn't shift the scene
+
+    params = SpringleParams.from_settings(settings)
+
+    circle_system = SpringleCircle(
+        params.min_circles, params.max_circles,
+        params.radial_velocity, params.angular_velocity,
+        params.radial_acceleration, params.angular_acceleration,
+        params.base_size, WIDTH, HEIGHT
+    )
+    # Circle system settings the app applies from its sliders
+    circle_system.set_max_groups(params.max_groups)
+    circle_system.color_transition_speed = settings['color_transition_speed']
+    circle_system.spawn_cooldown_start = settings['spawn_cooldown']
+    circle_system.spawn_cooldown_current = settings['spawn_cooldown']
+    circle_system.render_mode = render_mode
+    if not trail_lod:
+        circle_system.trail_lod = None
+
+    update_times = []
+    draw_times = []
+    peak_points = 0
+    peak_groups = 0
+    for frame in range(warmup + frames):
+        if drag_bursts:
+            simulate_drag_burst(frame, rng, params)
+
+        screen.fill(BACKGROUND)
+
+        start = time.perf_counter()
+        circle_system.update(DT, params)
+        updated = time.perf_counter()
+        circle_system.draw(screen, params.max_alpha)
+        drawn = time.perf_counter()
+
+        if frame >= warmup:
+            update_times.append(updated - start)
+            draw_times.append(drawn - updated)
+            peak_points = max(peak_points, len(circle_system.trails))
+            peak_groups = max(peak_groups, len(circle_system.groups))
+
+    return {
+        'params': SCENARIOS[name],
+        'update': summarize(update_times),
+        'draw': summarize(draw_times),
+        'total': summarize(np.add(update_times, draw_times)),
+        'peak_trail_points': peak_points,
+        'peak_groups': peak_groups,
+        'final_trail_points': len(circle_system.trails),
+        'final_groups': len(circle_system.groups),
+        'gradient_cache': circle_system.gradient_cache.stats(),
+        'tint_cache': circle_system.tint_cache.stats(),
+    }
+
+
+def pixel_diff(first, second):
+    """
+    Summarize the per-channel difference between two frames.
+
+    Args:
+        first (pygame.Surface): One frame
+        second (pygame.Surface): Frame of the same size to compare against
+
+    Returns:
+        dict: Mean, 99th percentile and max absolute difference on the 0-255
+        scale, and the fraction of pixels that differ at all
+    """
+    diff = np.abs(pygame.surfarray.array3d(first).astype(np.int16) -
+                  pygame.surfarray.array3d(second).astype(np.int16))
+    return {
+        'mean': round(float(diff.mean()), 4),
+        'p99': int(np.percentile(diff, 99)),
+        'max': int(diff.max()),
+        'changed_pixels': round(float((diff.max(axis=2) > 0).mean()), 4),
+    }
+
+
+def git_revision():
+    """Get the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).parent.parent, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless SpringleCircle benchmark')
+    parser.add_argument('--frames', type=int, default=600, help='Timed frames per scenario')
+    parser.add_argument('--warmup', type=int, default=120, help='Untimed frames before timing')
+    parser.add_argument('--seed', type=int, default=1234, help='RNG seed')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Scenario to run, may be repeated (default: all)')
+    parser.add_argument('--render-mode', default='redraw', choices=('redraw', 'accumulate'),
+                        help='SpringleCircle trail render mode')
+    parser.add_argument('--no-trail-lod', action='store_true',
+                        help='Disable decimation of aging trail points')
+    parser.add_argument('--lod-diff', action='store_true',
+                        help='Rerun each scenario with trail decimation toggled and '
+                             'report the pixel difference of the final frames')
+    parser.add_argument('--output', type=Path, help='Write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+            'size': [WIDTH, HEIGHT],
+            'dt': DT,
+            'frames': args.frames,
+            'warmup': args.warmup,
+            'seed': args.seed,
+            'render_mode': args.render_mode,
+            'trail_lod': not args.no_trail_lod,
+        },
+        'scenarios': {},
+    }
+
+    for name in args.scenario or list(SCENARIOS):
+        print(f"Running scenario '{name}'...", file=sys.stderr)
+        results['scenarios'][name] = run_scenario(
+            name, screen, args.frames, args.warmup, args.seed, args.render_mode,
+            not args.no_trail_lod)
+
+        if args.lod_diff:
+            # Same seed and input, so the runs only differ in the decimated points
+            final_frame = screen.copy()
+            run_scenario(name, screen, args.frames, args.warmup, args.seed, args.render_mode,
+                         args.no_trail_lod)
+            results['scenarios'][name]['lod_pixel_diff'] = pixel_diff(final_frame, screen)
+
+    pygame.quit()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(report + '\n')
+        print(f"Results saved to: {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -47,7 +47,9 @@ def setup_game():
         mouse_pos=(0, 0),
         fade_duration=5.0,
         space_factor=0.5,
-        auto_generate=True
+        auto_generate=True,
+        max_groups=10,
+        max_alpha=128
     )
     
     circle_system = SpringleCircle(
@@ -56,6 +58,7 @@ def setup_game():
         params.radial_acceleration, params.angular_acceleration,
         params.base_size, WIDTH, HEIGHT
     )
+    circle_system.set_max_groups(params.max_groups)
     
     return screen, circle_system, (WIDTH, HEIGHT), params
 
@@ -115,7 +118,7 @@ def simulate_complex_scene(duration_seconds=5):
         
         # Regular update and draw
         circle_system.update(1/60, params)
-        circle_system.draw(screen, 128)
+        circle_system.draw(screen, params.max_alpha)
         
         pygame.display.flip()
         
@@ -153,7 +156,7 @@ def run_line_profiler():
     profile.add_function(SpringleCircle.draw)
     profile.add_function(SpringleCircle.update)
     profile.add_function(SpringleCircle.calculate_circle_size)
-    profile.add_function(SpringleCircle.should_add_trail_point)
+    profile.add_function(SpringleCircle._emit_trail_points)
     
     profile.runcall(simulate_complex_scene)
     
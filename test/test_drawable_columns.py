@@ -0,0 +1,52 @@
+# test/test_drawable_columns.py
+
+"""
+Checks the draw order of SpringleCircle.get_drawable_columns and that the
+columns stay valid while the simulation goes on.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+
+def simulated_system(frames=300):
+    random.seed(4)
+    params = SpringleParams.from_settings()
+    circle_system = SpringleCircle(4, 12, 25, 1.0, 0.5, 3, 20, 480, 480)
+    circle_system.spawn_cooldown_start = 0.4
+    for _ in range(frames):
+        circle_system.update(1 / 60, params)
+    return circle_system, params
+
+
+def test_groups_are_drawn_oldest_first_with_heads_on_top():
+    circle_system, params = simulated_system()
+    columns = circle_system.get_drawable_columns(params.max_alpha)
+    heads = sum(len(group.circles) for group in circle_system.groups if group.active)
+    assert len(columns['x']) > heads
+    assert columns['rgb'].shape == (len(columns['x']), 3)
+
+    # Heads are the only full alpha elements, each closing its group's run
+    is_head = columns['alpha'] == 255
+    assert is_head.sum() == heads
+    runs = np.flatnonzero(np.diff(is_head.astype(np.int8)) == -1)
+    assert len(runs) == len([group for group in circle_system.groups if group.active]) - 1
+
+
+def test_columns_are_not_views_of_the_trails():
+    circle_system, params = simulated_system()
+    columns = circle_system.get_drawable_columns(params.max_alpha)
+    x = columns['x'].copy()
+    for _ in range(30):
+        circle_system.update(1 / 60, params)
+    np.testing.assert_array_equal(columns['x'], x)
+
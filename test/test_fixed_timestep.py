@@ -0,0 +1,53 @@
+# test/test_fixed_timestep.py
+
+"""
+Checks FixedTimestep step counting and interpolation alpha.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.FixedTimestep import FixedTimestep
+
+
+def test_frames_at_the_step_rate_take_one_step():
+    timestep = FixedTimestep(60)
+    assert [timestep.advance(1 / 60) for _ in range(600)] == [1] * 600
+    assert timestep.alpha < 1e-6
+
+
+def test_no_time_is_lost_over_uneven_frames():
+    timestep = FixedTimestep(60)
+    frames = [1 / 144, 1 / 30, 0.021, 1 / 75] * 100
+    steps = sum(timestep.advance(dt) for dt in frames)
+    assert math.isclose(steps * timestep.step + timestep.accumulator, sum(frames))
+    assert 0 <= timestep.alpha < 1
+
+
+def test_alpha_is_the_leftover_fraction():
+    timestep = FixedTimestep(50)
+    assert timestep.advance(0.005) == 0
+    assert math.isclose(timestep.alpha, 0.25)
+    assert timestep.advance(0.04) == 2
+    assert math.isclose(timestep.alpha, 0.25)
+
+
+def test_long_frames_are_capped():
+    timestep = FixedTimestep(60, max_steps=4)
+    assert timestep.advance(1.0) == 4
+    assert timestep.accumulator == 0.0
+    assert timestep.advance(-1.0) == 0
+
+
+def test_set_rate_keeps_the_fraction():
+    timestep = FixedTimestep(60)
+    timestep.advance(1.5 / 60)
+    timestep.set_rate(30)
+    assert math.isclose(timestep.alpha, 0.5)
+    assert math.isclose(timestep.accumulator, 0.5 / 30)
+    timestep.reset()
+    assert timestep.alpha == 0.0
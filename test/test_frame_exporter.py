@@ -0,0 +1,68 @@
+# test/test_frame_exporter.py
+
+"""
+Exports a short clip as an animated GIF and checks the frames are written
+as they arrive. Skipped when Pillow is not installed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Must be set before pygame initializes
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.FrameExporter import main, write_gif
+
+SIZE = (48, 32)
+
+
+def test_gif_frames_are_written_as_they_arrive(tmp_path):
+    path = tmp_path / 'clip.gif'
+    sizes = []
+
+    def frames():
+        for shade in range(0, 250, 50):
+            # The file only grows if the previous frames were already encoded
+            sizes.append(path.stat().st_size if path.exists() else 0)
+            pixels = np.zeros((SIZE[1], SIZE[0], 3), dtype=np.uint8)
+            pixels[:, :, 0] = shade
+            pixels[:, SIZE[0] // 2:, 2] = 255 - shade
+            yield pixels.tobytes()
+
+    assert write_gif(frames(), path, SIZE, fps=20) == 5
+    assert all(later > earlier for earlier, later in zip(sizes[1:], sizes[2:]))
+
+    with Image.open(path) as gif:
+        assert gif.n_frames == 5
+        assert gif.info['loop'] == 0
+        for index, shade in enumerate(range(0, 250, 50)):
+            gif.seek(index)
+            assert gif.info['duration'] == 50
+            pixels = np.asarray(gif.convert('RGB'), dtype=np.int16)
+            assert np.abs(pixels[:, 0] - [shade, 0, 0]).max() <= 8
+            assert np.abs(pixels[:, -1] - [shade, 0, 255 - shade]).max() <= 8
+
+
+def test_empty_clip_writes_nothing(tmp_path):
+    path = tmp_path / 'empty.gif'
+    assert write_gif(iter(()), path, SIZE, fps=20) == 0
+    assert not path.exists()
+
+
+def test_export_gif_from_the_command_line(tmp_path):
+    path = tmp_path / 'clip.gif'
+    main([str(path), '--duration', '0.5', '--fps', '10', '--width', '120', '--height', '90',
+          '--scale', '0.5', '--workers', '2'])
+    with Image.open(path) as gif:
+        assert gif.n_frames == 5
+        assert gif.size == (60, 45)
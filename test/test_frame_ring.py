@@ -0,0 +1,77 @@
+# test/test_frame_ring.py
+
+"""
+Checks that FrameRing hands the drawable columns across shared memory intact.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SimulationProcess import FrameRing
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+
+def drawable_columns():
+    random.seed(2)
+    params = SpringleParams.from_settings()
+    circle_system = SpringleCircle(4, 12, 25, 1.0, 0.5, 3, 20, 480, 480)
+    for _ in range(120):
+        circle_system.update(1 / 60, params)
+    return circle_system.get_drawable_columns(params.max_alpha)
+
+
+def test_read_latest_matches_written_columns():
+    columns = drawable_columns()
+    ring = FrameRing(capacity=4096, slots=3)
+    try:
+        assert ring.read_latest() is None
+        assert ring.write(7, 1.5, 3, columns) == 0
+        snapshot = ring.read_latest()
+        assert (snapshot.frame, snapshot.simulation_time, snapshot.active_groups) == (7, 1.5, 3)
+        for name in ('x', 'y', 'size'):
+            np.testing.assert_allclose(snapshot.columns[name], columns[name], rtol=1e-6)
+        np.testing.assert_array_equal(snapshot.columns['rgb'], columns['rgb'])
+        np.testing.assert_array_equal(snapshot.columns['alpha'], columns['alpha'])
+
+        # The columns are drawn straight from the shared memory block
+        assert any(np.shares_memory(snapshot.columns, slot) for slot in ring.slot_elements)
+        del snapshot
+    finally:
+        ring.close(unlink=True)
+
+
+def test_leased_slot_is_not_overwritten():
+    columns = drawable_columns()
+    empty = {name: values[:0] for name, values in columns.items()}
+    ring = FrameRing(capacity=4096, slots=3)
+    try:
+        ring.write(1, 0.0, 0, columns)
+        snapshot = ring.read_latest()
+        for frame in range(2, 12):
+            ring.write(frame, 0.0, 0, empty)
+        np.testing.assert_array_equal(snapshot.columns['alpha'], columns['alpha'])
+
+        # Reading the next frame moves the lease on
+        latest = ring.read_latest()
+        assert latest.frame == 11 and len(latest.columns) == 0
+        del snapshot, latest
+    finally:
+        ring.close(unlink=True)
+
+
+def test_full_slot_keeps_newest_elements():
+    columns = drawable_columns()
+    ring = FrameRing(capacity=100, slots=3)
+    try:
+        dropped = ring.write(1, 0.0, 0, columns)
+        assert dropped == len(columns['x']) - 100
+        np.testing.assert_array_equal(ring.read_latest().columns['alpha'], columns['alpha'][-100:])
+    finally:
+        ring.close(unlink=True)
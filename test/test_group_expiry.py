@@ -0,0 +1,87 @@
+# test/test_group_expiry.py
+
+"""
+Checks that SpringleCircle expires groups at their predicted exit time and
+trims groups when the limits drop.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+SIZE = 600
+
+
+def test_groups_expire_when_they_leave_the_screen():
+    random.seed(3)
+    params = SpringleParams.from_settings()
+    circle_system = SpringleCircle(4, 12, 25, 1.0, 0.5, 3, 20, SIZE, SIZE)
+    circle_system.spawn_cooldown_start = 0.5
+    rng = random.Random(1)
+
+    expired = 0
+    for frame in range(3000):
+        # Change the acceleration now and then, including pulling groups back in
+        if frame % 500 == 0:
+            params.radial_acceleration = rng.choice([-20, 3, 30, 100])
+
+        active = [group for group in circle_system.groups if group.active]
+        circle_system.update(1 / 60, params)
+        for group in active:
+            if not group.active:
+                expired += 1
+                assert not group.is_circle_visible((SIZE, SIZE))
+            else:
+                # Still active only while visible, or if it left during this step
+                engine = circle_system.engine
+                slot = group.circles[0]['motion'].slot
+                assert (group.is_circle_visible((SIZE, SIZE)) or
+                        abs(engine.previous_radius[slot]) <= SIZE * group.VISIBILITY_MARGIN)
+    assert expired > 20
+
+
+def test_expiry_follows_acceleration_changes():
+    random.seed(0)
+    params = SpringleParams.from_settings()
+    params.auto_generate = False
+    circle_system = SpringleCircle(4, 12, 25, 1.0, 0.5, 3, 20, SIZE, SIZE)
+    group = circle_system.groups[0]
+    circle_system.update(1 / 60, params)
+    slow_expiry = group.expiry_time
+
+    # Per-group variation scales the acceleration, possibly negatively
+    params.radial_acceleration = 200
+    circle_system.update(1 / 60, params)
+    expiry_time = group.expiry_time
+    assert expiry_time != slow_expiry
+    while group.active:
+        circle_system.update(1 / 60, params)
+    assert 0 <= circle_system.simulation_time - expiry_time < 1 / 60 + 1e-9
+
+
+def test_group_limits_remove_oldest_first():
+    random.seed(0)
+    params = SpringleParams.from_settings()
+    circle_system = SpringleCircle(4, 12, 25, 1.0, 0.5, 3, 20, SIZE, SIZE)
+    for _ in range(5):
+        circle_system.create_group(params)
+    groups = list(circle_system.groups)
+
+    circle_system.set_max_groups(4)
+    assert circle_system.groups == groups[2:]
+    assert all(group.expiry_time is None for group in groups[:2])
+
+    groups[3].is_mouse_group = True
+    circle_system.enforce_group_limit(2)
+    assert circle_system.groups == [groups[3], groups[5]]
+
+    # Entries of removed groups are left in the heap as stale
+    live = [group for expiry_time, _, group in circle_system._expiry_heap
+            if group.expiry_time == expiry_time]
+    assert all(group in circle_system.groups for group in live)
@@ -0,0 +1,76 @@
+# test/test_kivy_mesh_renderer.py
+
+"""
+Smoke test of the Kivy MeshRenderer shader on Mesa's software GL.
+
+The Kivy app has its own lib package, so the frame is drawn in a child
+process started from kivySpringle with LIBGL_ALWAYS_SOFTWARE=1. It renders
+one gradient quad into an Fbo and reports the GL renderer, whether the
+shader compiled and a few pixels. Skipped when Kivy is not installed, no
+window can be opened, or the GL driver is not Mesa.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+KIVY_DIR = Path(__file__).parent.parent / 'kivySpringle'
+SIZE = 64
+
+SCRIPT = f'''
+import json
+import numpy as np
+from kivy.core.window import Window
+if Window is None:
+    print(json.dumps({{'window': False}}))
+    raise SystemExit
+from kivy.graphics import ClearBuffers, ClearColor, Fbo
+from kivy.graphics.opengl import GL_RENDERER, glGetString
+from lib.MeshRenderer import MeshRenderer
+
+renderer = MeshRenderer()
+fbo = Fbo(size=({SIZE}, {SIZE}))
+with fbo:
+    ClearColor(0, 0, 0, 0)
+    ClearBuffers()
+fbo.add(renderer.context)
+renderer.update(np.array([{SIZE / 2}]), np.array([{SIZE / 2}]), np.array([{SIZE * 0.75}]),
+                np.array([[255, 128, 0]]), np.array([255]), 1.0)
+fbo.draw()
+gl_renderer = glGetString(GL_RENDERER)
+pixels = np.frombuffer(fbo.pixels, dtype=np.uint8).reshape({SIZE}, {SIZE}, 4)
+print(json.dumps({{
+    'window': True,
+    'renderer': gl_renderer.decode() if isinstance(gl_renderer, bytes) else str(gl_renderer),
+    'shader': bool(renderer.context.shader.success),
+    'center': pixels[{SIZE // 2}, {SIZE // 2}].tolist(),
+    'edge': pixels[{SIZE // 2}, {SIZE // 2 + SIZE * 3 // 8 - 4}].tolist(),
+    'corner': pixels[0, 0].tolist(),
+}}))
+'''
+
+
+@pytest.mark.skipif(importlib.util.find_spec('kivy') is None, reason='Kivy is not installed')
+def test_mesh_renderer_draws_on_software_gl():
+    env = dict(os.environ, LIBGL_ALWAYS_SOFTWARE='1', KIVY_NO_ARGS='1',
+               KIVY_NO_CONSOLELOG='1', KIVY_NO_FILELOG='1')
+    result = subprocess.run([sys.executable, '-c', SCRIPT], cwd=KIVY_DIR, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    if not report['window']:
+        pytest.skip('No window provider, e.g. no display')
+    if not any(name in report['renderer'] for name in ('llvmpipe', 'softpipe', 'swrast')):
+        pytest.skip(f"GL driver ignores LIBGL_ALWAYS_SOFTWARE: {report['renderer']}")
+
+    assert report['shader']
+    # Full color at the center, fading towards the rim, nothing outside the circle
+    red, green, blue, alpha = report['center']
+    assert red > 200 and 80 < green < 180 and blue < 20 and alpha > 200
+    assert 0 < report['edge'][3] < alpha
+    assert report['corner'] == [0, 0, 0, 0]
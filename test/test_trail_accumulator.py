@@ -0,0 +1,92 @@
+# test/test_trail_accumulator.py
+
+"""
+Compares the 'accumulate' trail render mode against 'redraw'.
+
+Both modes render the same seeded scene headlessly; the accumulated frame
+must stay within a small mean and high-percentile pixel difference of the
+frame that redraws every trail point.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+# Must be set before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+import pytest
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+SIZE = 480
+BACKGROUND = (185, 150, 234)
+DT = 1 / 60
+
+
+@pytest.fixture(scope='module', autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def render_both(fade_duration, frames, seed=7):
+    """
+    Run a seeded scene in accumulate mode and redraw its last frame.
+
+    Returns:
+        tuple: (accumulated, redrawn) RGB arrays of the last frame
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    params = SpringleParams.from_settings()
+    params.fade_duration = fade_duration
+
+    circle_system = SpringleCircle(
+        params.min_circles, params.max_circles,
+        params.radial_velocity, params.angular_velocity,
+        params.radial_acceleration, params.angular_acceleration,
+        params.base_size, SIZE, SIZE
+    )
+    circle_system.render_mode = 'accumulate'
+    # Decimated points stay on the layers they were stamped onto, so compare
+    # the full trails
+    circle_system.trail_lod = None
+
+    accumulated = pygame.Surface((SIZE, SIZE))
+    for _ in range(frames):
+        circle_system.update(DT, params)
+        accumulated.fill(BACKGROUND)
+        circle_system.draw(accumulated, params.max_alpha)
+
+    redrawn = pygame.Surface((SIZE, SIZE))
+    redrawn.fill(BACKGROUND)
+    circle_system.draw_columns(redrawn, circle_system.get_drawable_columns(params.max_alpha))
+
+    return (pygame.surfarray.array3d(accumulated).astype(np.int16),
+            pygame.surfarray.array3d(redrawn).astype(np.int16))
+
+
+@pytest.mark.parametrize('fade_duration', [2.0, 5.0])
+def test_accumulate_matches_redraw(fade_duration):
+    # Long enough for the oldest layers to fade out and be recycled
+    accumulated, redrawn = render_both(fade_duration, frames=round(3 * fade_duration / DT))
+    difference = np.abs(accumulated - redrawn)
+
+    print(f"fade {fade_duration}: mean {difference.mean():.2f}, "
+          f"p99 {np.percentile(difference, 99):.0f}, max {difference.max()}")
+    assert (redrawn != BACKGROUND).any(axis=2).mean() > 0.2  # The scene has trails
+    # Current circles are drawn above every trail when accumulating, and the
+    # overlap correction is an average, so a small difference remains
+    assert difference.mean() < 3.5
+    assert np.percentile(difference, 99) < 24
@@ -0,0 +1,44 @@
+# test/test_trail_fade.py
+
+"""
+Checks the vectorized fade_alphas against the scalar fade it replaced.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.TrailFade import fade_alphas
+
+
+def scalar_fade(age, fade_duration, max_alpha, power):
+    """The per-point fade the renderers used before fade_alphas."""
+    fade_progress = min(1.0, age / fade_duration)
+    return int(max(0, max_alpha * (1 - fade_progress ** power)))
+
+
+@pytest.mark.parametrize('power', [2, 3])
+@pytest.mark.parametrize('fade_duration, max_alpha', [(5.0, 200), (0.7, 255), (30.0, 128)])
+def test_matches_scalar_fade(power, fade_duration, max_alpha):
+    rng = np.random.default_rng(11)
+    ages = np.concatenate((rng.uniform(0, fade_duration * 1.2, 5000),
+                           [0.0, fade_duration, fade_duration * 2, -0.5]))
+    alphas, visible = fade_alphas(ages, fade_duration, max_alpha, power)
+
+    expected = [scalar_fade(max(0.0, age), fade_duration, max_alpha, power) for age in ages]
+    np.testing.assert_array_equal(alphas, expected)
+    np.testing.assert_array_equal(visible, alphas > 0)
+    assert alphas.dtype == np.int32
+
+
+def test_buckets_round_to_alpha_step():
+    ages = np.linspace(0, 5, 200)
+    alphas, _, buckets = fade_alphas(ages, 5.0, 255, alpha_step=16)
+    expected = [min(255, round(alpha / 16) * 16) for alpha in alphas.tolist()]
+    np.testing.assert_array_equal(buckets, expected)
+    assert buckets.max() == 255
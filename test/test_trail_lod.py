@@ -0,0 +1,80 @@
+# test/test_trail_lod.py
+
+"""
+Renders the same seeded scene with and without trail decimation and checks
+the faded trails still look the same while fewer points are drawn.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+# Must be set before pygame initializes the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+import pytest
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.SpringleCircle import SpringleCircle
+from lib.SpringleParams import SpringleParams
+
+SIZE = 480
+DT = 1 / 60
+BACKGROUND = (185, 150, 234)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def render(fade_duration, trail_lod, seed=7):
+    """
+    Run a seeded scene for three fade durations and draw its last frame.
+
+    Returns:
+        tuple: RGB array of the frame, number of elements drawn
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    params = SpringleParams.from_settings()
+    params.fade_duration = fade_duration
+
+    circle_system = SpringleCircle(
+        params.min_circles, params.max_circles,
+        params.radial_velocity, params.angular_velocity,
+        params.radial_acceleration, params.angular_acceleration,
+        params.base_size, SIZE, SIZE
+    )
+    if not trail_lod:
+        circle_system.trail_lod = None
+
+    for _ in range(int(3 * fade_duration / DT)):
+        circle_system.update(DT, params)
+
+    screen = pygame.Surface((SIZE, SIZE))
+    screen.fill(BACKGROUND)
+    columns = circle_system.get_drawable_columns(params.max_alpha)
+    circle_system.draw_columns(screen, columns)
+    return pygame.surfarray.array3d(screen).astype(np.int16), len(columns['x'])
+
+
+@pytest.mark.parametrize('fade_duration, max_mean, max_p99', [(2.0, 4.0, 60), (5.0, 0.6, 4)])
+def test_decimated_trails_match_full_trails(fade_duration, max_mean, max_p99):
+    decimated, decimated_points = render(fade_duration, trail_lod=True)
+    full, full_points = render(fade_duration, trail_lod=False)
+    diff = np.abs(decimated - full)
+
+    assert decimated_points < full_points * 0.9
+    # Short fades overlap more bright points, so thinning them shows more
+    assert diff.mean() < max_mean
+    assert np.percentile(diff, 99) < max_p99
@@ -0,0 +1,93 @@
+# test/test_trail_ring.py
+
+"""
+Checks TrailRing expiry, trimming and decimation, including wrapped buffers.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path so we can import from lib
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lib.TrailRing import TrailRing
+
+
+def fill(ring, times, emit_index=None, group_time=0.0):
+    """Append one point per creation time, with x equal to the time."""
+    times = np.asarray(times, dtype=np.float64)
+    if emit_index is None:
+        emit_index = np.arange(len(times))
+    ring.extend(times, times * 2, np.zeros((len(times), 3), dtype=np.uint8),
+                np.full(len(times), 5.0), times, group_time, emit_index)
+
+
+def wrapped_ring():
+    """Get a ring whose live points wrap around the end of the buffer."""
+    ring = TrailRing(capacity=8)
+    fill(ring, np.arange(6))
+    ring.expire(5.5, 1.0)  # Keep only t=5
+    fill(ring, np.arange(6, 12))
+    assert ring.tail + ring.count > ring.capacity
+    return ring
+
+
+def test_expire_drops_points_older_than_fade():
+    ring = TrailRing(capacity=4)  # Grows while filling
+    fill(ring, np.arange(10) * 0.5)
+    assert ring.expire(4.0, 2.5) == 4  # t <= 1.5 removed
+    np.testing.assert_array_equal(ring.columns()['x'], np.arange(4, 10) * 0.5)
+    assert ring.expire(100.0, 1.0) == 6
+    assert len(ring) == 0 and ring.tail == 0
+
+
+def test_expire_and_columns_across_wrap():
+    ring = wrapped_ring()
+    np.testing.assert_array_equal(ring.columns()['x'], np.arange(5, 12))
+    assert ring.expire(10.0, 2.5) == 3  # t = 5, 6, 7
+    np.testing.assert_array_equal(ring.columns()['creation_time'], np.arange(8, 12))
+    np.testing.assert_array_equal(ring.newest(2)['y'], [20, 22])
+    np.testing.assert_array_equal(ring.ages(12.0), [4, 3, 2, 1])
+
+
+def test_trim_keeps_newest():
+    ring = wrapped_ring()
+    assert ring.trim(10) == 0
+    assert ring.trim(3) == 4
+    np.testing.assert_array_equal(ring.columns()['x'], [9, 10, 11])
+    assert ring.total_appended == 12
+
+
+def test_decimate_keeps_every_stride_point():
+    ring = TrailRing()
+    fill(ring, np.arange(20) * 0.1)
+    # Points older than 1.0s keep every 2nd, older than 1.5s every 4th
+    removed = ring.decimate(2.0, 2.0, ((0.5, 2), (0.75, 4)))
+    columns = ring.columns()
+    kept_old = columns['emit_index'][columns['creation_time'] <= 0.5]
+    kept_mid = columns['emit_index'][(columns['creation_time'] > 0.5) &
+                                     (columns['creation_time'] <= 1.0)]
+    assert np.all(kept_old % 4 == 0)
+    assert np.all(kept_mid % 2 == 0)
+    # Younger points are untouched and the order stays chronological
+    np.testing.assert_array_equal(columns['emit_index'][columns['creation_time'] > 1.0],
+                                  np.arange(11, 20))
+    assert np.all(np.diff(columns['creation_time']) > 0)
+    assert removed == 20 - len(ring)
+
+    # Each point is only checked once per level
+    assert ring.decimate(2.0, 2.0, ((0.5, 2), (0.75, 4))) == 0
+
+
+def test_decimate_across_wrap():
+    ring = wrapped_ring()
+    before = ring.columns()
+    removed = ring.decimate(12.0, 4.0, ((0.5, 2),))  # Points at t <= 10
+    after = ring.columns()
+    expected = [i for i, t in zip(before['emit_index'], before['creation_time'])
+                if t > 10 or i % 2 == 0]
+    np.testing.assert_array_equal(after['emit_index'], expected)
+    np.testing.assert_array_equal(after['x'], after['creation_time'])
+    assert removed == len(before['x']) - len(expected)